@@ -1,9 +1,20 @@
 from __future__ import annotations
 
+import atexit
+import base64
+import binascii
 import json
+import os
+import re
+import shutil
 import subprocess
-from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 
 class GitHubAPIError(RuntimeError):
@@ -25,12 +36,174 @@ class Repository:
         return f"{self.owner}/{self.name}"
 
 
-class GitHubAPI:
-    """Small wrapper around `gh api` with JSON helpers."""
+@dataclass(slots=True, frozen=True)
+class CheckContext:
+    """A status or check run observed on a commit."""
+
+    context: str
+    integration_id: Optional[int]
+    app_slug: Optional[str]
+    app_name: Optional[str]
+    type: str
+
+
+@dataclass(slots=True)
+class PullRequestChecks:
+    """Head of a pull request and the checks observed on it."""
+
+    number: int
+    head_ref: Optional[str]
+    merged: bool
+    contexts: List[CheckContext]
+
 
-    def __init__(self, repo: Repository, *, api_version: str = "2022-11-28") -> None:
+@dataclass(slots=True)
+class CheckContextBatch:
+    """Everything resolved by :meth:`GitHubAPI.batch_check_contexts`.
+
+    Pull requests that could not be resolved map to ``None``.
+    """
+
+    default_branch: Optional[str] = None
+    default_contexts: List[CheckContext] = field(default_factory=list)
+    refs: Dict[str, List[CheckContext]] = field(default_factory=dict)
+    pull_requests: Dict[int, Optional[PullRequestChecks]] = field(default_factory=dict)
+    latest_pull_request: Optional[PullRequestChecks] = None
+
+
+class GitHubAPI:
+    """Small wrapper around `gh api` with JSON helpers.
+
+    GET responses are kept in memory for ``cache_ttl`` seconds so repeated
+    lookups within one command do not hit the network again. Any write
+    request drops the cache. With ``disk_cache`` enabled, GET requests are
+    also sent as conditional requests using the ETag stored by a previous
+    run; a 304 answer reuses the stored body and does not count against the
+    primary rate limit. The checks observed on a commit SHA are kept on disk
+    as well, for ``checks_cache_ttl`` seconds.
+    """
+
+    def __init__(
+        self,
+        repo: Repository,
+        *,
+        api_version: str = "2022-11-28",
+        cache_ttl: float = 30.0,
+        checks_cache_ttl: float = 600.0,
+        disk_cache: bool = True,
+    ) -> None:
         self.repo = repo
         self.api_version = api_version
+        self.cache_ttl = cache_ttl
+        self._env: Optional[Dict[str, str]] = None
+        # Arguments shared by every `gh api` call, assembled once.
+        self._api_args: Tuple[str, ...] = (
+            "api",
+            *(("--hostname", repo.hostname) if repo.hostname else ()),
+        )
+        self._fixed_headers: Tuple[str, ...] = (
+            "-H",
+            "Accept: application/vnd.github+json",
+            "-H",
+            f"X-GitHub-Api-Version: {api_version}",
+        )
+        self._cache: Dict[Tuple[str, Tuple[str, ...]], Tuple[float, bytes]] = {}
+        self._inflight: Dict[Tuple[str, Tuple[str, ...]], _InFlight] = {}
+        self._inflight_lock = threading.Lock()
+        self._etags = _ETagStore(cache_directory() / "etags.json") if disk_cache else None
+        self._checks: Optional[_ChecksStore] = None
+        if disk_cache:
+            checks_directory = cache_directory() / "checks" / (repo.hostname or "github.com") / repo.owner / repo.name
+            self._checks = _ChecksStore(checks_directory, checks_cache_ttl)
+        # Cleared after a failed GraphQL call so later lookups go straight to REST.
+        self._graphql_usable = True
+        # Unaffected by ruleset writes, so kept for the whole process.
+        self._default_branch: Optional[str] = None
+        self._branch_heads: Dict[str, str] = {}
+        self._team_ids: Dict[str, int] = {}
+        # Team IDs are per host. Without --hostname or GH_HOST the host gh
+        # targets is not known here, so they are only kept for this process.
+        self._team_host = repo.hostname or os.environ.get("GH_HOST")
+        self._teams_path = cache_directory() / "teams.json" if disk_cache and self._team_host else None
+        self._teams: Optional[Dict[str, Any]] = None
+
+    def _subprocess_env(self) -> Dict[str, str]:
+        """Environment for `gh` children, with the auth token resolved once.
+
+        Each `gh` process otherwise looks the token up in the system keyring
+        on startup. Exporting it through the variable gh reads first lets every
+        subsequent call skip that lookup.
+        """
+
+        if self._env is not None:
+            return self._env
+
+        env = dict(os.environ)
+        host = self.repo.hostname or env.get("GH_HOST") or "github.com"
+        if _is_enterprise_host(host):
+            token_vars = ("GH_ENTERPRISE_TOKEN", "GITHUB_ENTERPRISE_TOKEN")
+        else:
+            token_vars = ("GH_TOKEN", "GITHUB_TOKEN")
+
+        if not any(env.get(name) for name in token_vars):
+            command = [gh_executable(), "auth", "token"]
+            if self.repo.hostname:
+                command.extend(["--hostname", self.repo.hostname])
+            try:
+                completed = subprocess.run(
+                    command,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    close_fds=False,
+                    check=True,
+                )
+            except (OSError, subprocess.CalledProcessError):
+                # Let gh report authentication problems on the actual call.
+                completed = None
+            if completed:
+                token = completed.stdout.decode("utf-8").strip()
+                if token:
+                    env[token_vars[0]] = token
+
+        self._env = env
+        return env
+
+    def _gh(self, args: List[str], stdin: Optional[bytes] = None) -> subprocess.CompletedProcess:
+        """Run a gh command with the shared environment; the caller checks the result."""
+
+        # close_fds=False plus an absolute executable path lets CPython spawn
+        # gh with posix_spawn instead of fork+exec. Descriptors opened by
+        # Python are non-inheritable (PEP 446), so nothing leaks to the child.
+        return subprocess.run(
+            [gh_executable(), *args],
+            input=stdin,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=self._subprocess_env(),
+            close_fds=False,
+        )
+
+    def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a GraphQL query through `gh api graphql` and return its ``data``.
+
+        GitHub answers partial failures with both ``data`` and ``errors``; gh
+        then exits non-zero but still prints the body, so whatever data came
+        back is returned and only a response without any data is an error.
+        """
+
+        command = [*self._api_args, "graphql", "--input", "-"]
+        payload = json.dumps({"query": query, "variables": variables}, separators=(",", ":"))
+        completed = self._gh(command, payload.encode("utf-8"))
+
+        try:
+            response = None if _is_blank(completed.stdout) else json.loads(completed.stdout)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            response = None
+        data = response.get("data") if isinstance(response, dict) else None
+        if not isinstance(data, dict):
+            stderr = completed.stderr.decode("utf-8", errors="replace")
+            raise GitHubAPIError(f"Échec de la requête GraphQL : {stderr}", stderr=stderr)
+        return data
 
     def _run(
         self,
@@ -39,65 +212,140 @@ class GitHubAPI:
         method: str = "GET",
         input_data: Optional[Dict[str, Any]] = None,
         params: Optional[Iterable[str]] = None,
+        silent: bool = False,
     ) -> Any:
-        """Invoke `gh api` with JSON response."""
-
-        command: List[str] = ["gh", "api"]
-        if self.repo.hostname:
-            command.extend(["--hostname", self.repo.hostname])
-        command.extend(
-            [
-                f"/repos/{self.repo.full_name}/{path.lstrip('/')}",
-                "--method",
-                method.upper(),
-                "-H",
-                "Accept: application/vnd.github+json",
-                "-H",
-                f"X-GitHub-Api-Version: {self.api_version}",
-            ]
-        )
-
+        """Invoke `gh api` with JSON response.
+
+        ``path`` is relative to the repository endpoint unless it starts with
+        a slash. With ``silent``, gh discards the response body and None is
+        returned.
+        """
+
+        method = method.upper()
+        params = tuple(params or ())
+        if method != "GET" or input_data is not None:
+            self._cache.clear()
+            return _parse_json_output(self._request(path, method, params, input_data, silent, None), method, path)
+
+        cache_key = (path, params)
+        cached = self._cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self.cache_ttl:
+            return _parse_json_output(cached[1], method, path)
+
+        # Pool threads often ask for the same resource at once (a PR given
+        # twice, a ref naming the default branch...): the first request is
+        # sent and the others wait for its answer.
+        with self._inflight_lock:
+            pending = self._inflight.get(cache_key)
+            leader = pending is None
+            if leader:
+                pending = self._inflight[cache_key] = _InFlight()
+        if not leader:
+            return _parse_json_output(pending.wait(), method, path)
+        try:
+            pending.body = self._request(path, method, params, None, silent, cache_key)
+        except BaseException as exc:
+            pending.error = exc
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[cache_key]
+            pending.done.set()
+        return _parse_json_output(pending.body, method, path)
+
+    def _request(
+        self,
+        path: str,
+        method: str,
+        params: Tuple[str, ...],
+        input_data: Optional[Dict[str, Any]],
+        silent: bool,
+        cache_key: Optional[Tuple[str, Tuple[str, ...]]],
+    ) -> bytes:
+        """Send one `gh api` request and return the response body.
+
+        ``cache_key`` is set for reads, which are then conditional and stored
+        in the in-memory cache.
+        """
+        if path.startswith("/"):
+            endpoint = path
+        else:
+            endpoint = f"/repos/{self.repo.full_name}"
+            if path:
+                endpoint += f"/{path}"
+        # GET is gh's default as long as no -f/-F field is passed; reads put
+        # their query in the endpoint so the flag can be left out.
+        command: List[str] = [*self._api_args, endpoint, *self._fixed_headers]
+        if method != "GET":
+            command.extend(("--method", method))
         if params:
             command.extend(params)
 
+        etag_key: Optional[str] = None
+        stored: Optional[Tuple[str, bytes]] = None
+        if cache_key is not None and self._etags is not None:
+            etag_key = " ".join([self.repo.hostname or "", endpoint, *params])
+            stored = self._etags.get(etag_key)
+            command.append("--include")
+            if stored:
+                command.extend(["-H", f"If-None-Match: {stored[0]}"])
+
         stdin_bytes: Optional[bytes] = None
         if input_data is not None:
             command.extend(["--input", "-"])
             stdin_bytes = json.dumps(input_data, separators=(",", ":")).encode("utf-8")
-
-        try:
-            completed = subprocess.run(
-                command,
-                input=stdin_bytes,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                check=True,
-            )
-        except subprocess.CalledProcessError as exc:  # pragma: no cover - interactive flow
-            stderr = exc.stderr.decode("utf-8", errors="replace")
+        if silent:
+            command.append("--silent")
+
+        completed = self._gh(command, stdin_bytes)
+
+        body = completed.stdout
+        not_modified = False
+        if etag_key is not None:
+            status, etag, body = _split_included_response(body)
+            if status == 304 and stored is not None:
+                # gh exits with an error on 304; the stored body is current.
+                not_modified = True
+                body = stored[1]
+            elif completed.returncode == 0 and etag:
+                self._etags.put(etag_key, etag, body)
+
+        if completed.returncode != 0 and not not_modified:  # pragma: no cover - interactive flow
+            stderr = completed.stderr.decode("utf-8", errors="replace")
             raise GitHubAPIError(
                 f"Échec de l'appel API GitHub ({method} {path}): {stderr}",
                 stderr=stderr,
-            ) from exc
-
-        stdout_text = completed.stdout.decode("utf-8")
-        if not stdout_text.strip():
-            return None
+            )
 
-        try:
-            return json.loads(stdout_text)
-        except json.JSONDecodeError as exc:
-            raise GitHubAPIError(
-                f"Réponse JSON invalide pour {method} {path}: {stdout_text}",
-            ) from exc
+        # Cache the raw body and parse on every hit so callers can freely
+        # mutate what they get back.
+        if cache_key is not None:
+            self._cache[cache_key] = (time.monotonic(), body)
+        return body
 
     # Repository rulesets -------------------------------------------------
 
-    def list_rulesets(self, *, include_links: bool = False) -> List[Dict[str, Any]]:
-        params: List[str] = []
-        if include_links:
-            params.extend(["--include", "next"])
-        return self._run("rulesets", params=params)
+    def iter_rulesets(self, *, per_page: int = 100, jq: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Yield the repository rulesets one page at a time.
+
+        ``jq`` is applied by gh to each page before it is returned; it must
+        map the page array to an array with one entry per ruleset.
+        """
+        page = 1
+        jq_params = ("--jq", jq) if jq else ()
+        while True:
+            items = self._run(f"rulesets?per_page={per_page}&page={page}", params=jq_params) or []
+            yield from items
+            if len(items) < per_page:
+                return
+            page += 1
+
+    def list_rulesets(self) -> List[Dict[str, Any]]:
+        return list(self.iter_rulesets())
+
+    def iter_ruleset_summaries(self) -> Iterator[Dict[str, Any]]:
+        """Yield only the fields shown by ``list``, projected by gh's jq."""
+        return self.iter_rulesets(jq=_RULESET_SUMMARY_JQ)
 
     def get_ruleset(self, ruleset_id: int) -> Dict[str, Any]:
         return self._run(f"rulesets/{ruleset_id}")
@@ -108,8 +356,19 @@ class GitHubAPI:
     def create_ruleset(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         return self._run("rulesets", method="POST", input_data=payload)
 
-    def update_ruleset(self, ruleset_id: int, payload: Dict[str, Any]) -> Dict[str, Any]:
-        return self._run(f"rulesets/{ruleset_id}", method="PUT", input_data=payload)
+    def update_ruleset(
+        self,
+        ruleset_id: int,
+        payload: Dict[str, Any],
+        *,
+        return_body: bool = True,
+    ) -> Optional[Dict[str, Any]]:
+        return self._run(
+            f"rulesets/{ruleset_id}",
+            method="PUT",
+            input_data=payload,
+            silent=not return_body,
+        )
 
     def list_available_rules(self) -> List[Dict[str, Any]]:
         return self._run("rulesets/rules")
@@ -125,137 +384,617 @@ class GitHubAPI:
         return sha, head.get("ref")
 
     def get_latest_open_pull_request(self) -> Optional[Dict[str, Any]]:
-        prs = self._run(
-            "pulls",
-            params=[
-                "-f",
-                "state=open",
-                "-f",
-                "sort=updated",
-                "-f",
-                "direction=desc",
-                "-f",
-                "per_page=1",
-            ],
-        )
+        prs = self._run(_LATEST_OPEN_PR_PATH)
         if isinstance(prs, list) and prs:
             return prs[0]
         return None
 
     def get_latest_merged_pull_request(self) -> Optional[Dict[str, Any]]:
-        page = 1
-        per_page = 20
-        while page <= 5:
-            prs = self._run(
-                "pulls",
-                params=[
-                    "-f",
-                    "state=closed",
-                    "-f",
-                    "sort=updated",
-                    "-f",
-                    "direction=desc",
-                    "-f",
-                    f"per_page={per_page}",
-                    "-f",
-                    f"page={page}",
-                ],
-            )
-            if not prs:
-                break
-            for pr in prs:
-                if pr.get("merged_at"):
-                    return pr
-            if len(prs) < per_page:
-                break
-            page += 1
-        return None
+        """Return the most recently updated merged PR, shaped like the REST one."""
+        if self._graphql_usable:
+            try:
+                data = self._graphql(
+                    _LATEST_MERGED_PR_QUERY,
+                    {"owner": self.repo.owner, "name": self.repo.name},
+                )
+            except GitHubAPIError:
+                self._graphql_usable = False
+            else:
+                nodes = ((data.get("repository") or {}).get("pullRequests") or {}).get("nodes") or []
+                if not nodes or not nodes[0]:
+                    return None
+                pr = nodes[0]
+                return {
+                    "number": pr.get("number"),
+                    "title": pr.get("title"),
+                    "state": "closed",
+                    "merged_at": pr.get("mergedAt"),
+                    "head": {"sha": pr.get("headRefOid"), "ref": pr.get("headRefName")},
+                }
+
+        # REST fallback: scan one page of recently updated closed PRs.
+        prs = self._run(_RECENT_CLOSED_PRS_PATH, params=("--jq", _FIRST_MERGED_PR_JQ))
+        return prs[0] if isinstance(prs, list) and prs else None
 
     # Helpers -------------------------------------------------------------
 
     def get_default_branch(self) -> str:
-        data = self._call_repo_view(["--json", "defaultBranchRef", "--jq", ".defaultBranchRef.name"])
-        if not data:
+        if self._default_branch:
+            return self._default_branch
+        data = self._run("") or {}
+        branch = data.get("default_branch")
+        if not branch:
             raise GitHubAPIError("Impossible de déterminer la branche par défaut du dépôt.")
-        return data.strip()
+        self._default_branch = branch
+        return branch
 
     def get_latest_commit_sha(self, branch: str) -> str:
+        sha = self._branch_heads.get(branch)
+        if sha:
+            return sha
         response = self._run(f"commits/{branch}")
         sha = response.get("sha")
         if not sha:
             raise GitHubAPIError(f"Impossible de récupérer le dernier commit pour {branch}.")
+        self._branch_heads[branch] = sha
         return sha
 
-    def list_check_contexts(self, ref: str) -> List[Dict[str, Any]]:
-        """Return unique status check contexts for a ref."""
-        entries: List[Dict[str, Any]] = []
-        seen: set[tuple[str, Optional[int], Optional[str], str]] = set()
+    # Organisation teams --------------------------------------------------
+
+    def get_team_id(self, org: str, slug: str) -> int:
+        """Return the numeric ID of team ``org/slug``.
+
+        A slug keeps its ID unless the team is renamed, so IDs are remembered
+        for the process and, with ``disk_cache``, on disk for a day.
+        """
+        team_id = self._cached_team_id(org, slug)
+        if team_id is not None:
+            return team_id
+        # Only the ID is needed: gh extracts it, so Python parses a bare integer.
+        team_id = self._run(f"/orgs/{org}/teams/{slug}", params=("--jq", ".id"))
+        if not isinstance(team_id, int):
+            raise GitHubAPIError(f"Impossible de récupérer l'identifiant de la team {org}/{slug}.")
+        self._remember_team_id(org, slug, team_id)
+        return team_id
+
+    def get_team_ids(self, teams: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], Optional[int]]:
+        """Return the IDs of several ``(org, slug)`` teams; unknown teams map to ``None``.
+
+        Teams missing from the caches are resolved together by one GraphQL
+        query, or by one REST call each when GraphQL is not usable.
+        """
+        result: Dict[Tuple[str, str], Optional[int]] = {}
+        missing: List[Tuple[str, str]] = []
+        for team in dict.fromkeys(teams):
+            result[team] = self._cached_team_id(*team)
+            if result[team] is None:
+                missing.append(team)
+        if not missing:
+            return result
+
+        if self._graphql_usable:
+            declarations: List[str] = []
+            variables: Dict[str, Any] = {}
+            selections: List[str] = []
+            for index, (org, slug) in enumerate(missing):
+                declarations += [f"$org{index}: String!", f"$slug{index}: String!"]
+                variables[f"org{index}"] = org
+                variables[f"slug{index}"] = slug
+                selections.append(
+                    f"t{index}: organization(login: $org{index}) {{ team(slug: $slug{index}) {{ databaseId }} }}"
+                )
+            query = f"query({', '.join(declarations)}) {{\n  " + "\n  ".join(selections) + "\n}\n"
+            try:
+                data = self._graphql(query, variables)
+            except GitHubAPIError:
+                self._graphql_usable = False
+            else:
+                for index, team in enumerate(missing):
+                    # An unknown organisation or team resolves to null.
+                    team_id = ((data.get(f"t{index}") or {}).get("team") or {}).get("databaseId")
+                    if isinstance(team_id, int):
+                        result[team] = team_id
+                        self._remember_team_id(*team, team_id)
+                return result
+
+        for team in missing:
+            try:
+                result[team] = self.get_team_id(*team)
+            except GitHubAPIError:
+                pass
+        return result
+
+    def _team_cache_key(self, org: str, slug: str) -> str:
+        return f"{self._team_host or ''} {org.lower()}/{slug.lower()}"
+
+    def _cached_team_id(self, org: str, slug: str) -> Optional[int]:
+        key = self._team_cache_key(org, slug)
+        team_id = self._team_ids.get(key)
+        if team_id is None and self._teams_path is not None:
+            entry = self._stored_teams().get(key)
+            if isinstance(entry, dict) and time.time() - entry.get("stored_at", 0) < _TEAM_CACHE_TTL:
+                team_id = self._team_ids[key] = entry["id"]
+        return team_id
+
+    def _remember_team_id(self, org: str, slug: str, team_id: int) -> None:
+        key = self._team_cache_key(org, slug)
+        self._team_ids[key] = team_id
+        if self._teams_path is not None:
+            teams = self._stored_teams()
+            teams[key] = {"id": team_id, "stored_at": time.time()}
+            _write_cache_file(self._teams_path, teams)
+
+    def _stored_teams(self) -> Dict[str, Any]:
+        if self._teams is None:
+            stored = _read_cache_file(self._teams_path) if self._teams_path is not None else None
+            self._teams = stored if isinstance(stored, dict) else {}
+        return self._teams
+
+    # Status checks -------------------------------------------------------
+
+    def _cached_checks(self, ref: str) -> Optional[List[CheckContext]]:
+        """Checks stored for ``ref`` by a recent run, when ``ref`` is a commit SHA.
+
+        Branch names are never looked up: they move, a SHA does not.
+        """
+        if self._checks is None or not _COMMIT_SHA_RE.fullmatch(ref):
+            return None
+        return self._checks.get(ref)
 
-        try:
-            status = self._run(f"commits/{ref}/status")
-        except GitHubAPIError:
-            status = {}
-        for status_obj in status.get("statuses", []):
-            context = status_obj.get("context")
-            if not context:
-                continue
-            key = (context, None, None, "status")
-            if key in seen:
-                continue
-            seen.add(key)
-            entries.append(
-                {
-                    "context": context,
-                    "integration_id": None,
-                    "app_slug": None,
-                    "app_name": None,
-                    "type": "status",
-                }
-            )
+    def _commit_contexts(self, commit: Dict[str, Any]) -> List[CheckContext]:
+        """Convert a ``CommitChecks`` node, storing the result under its SHA."""
+        contexts = _check_contexts_from_commit(commit)
+        sha = commit.get("oid")
+        if sha and self._checks is not None:
+            self._checks.put(sha, contexts)
+        return contexts
 
-        try:
-            check_runs = self._run(f"commits/{ref}/check-runs")
-        except GitHubAPIError:
-            check_runs = {}
+    def list_check_contexts(self, ref: str) -> List[CheckContext]:
+        """Return unique status check contexts for a ref."""
+        cached = self._cached_checks(ref)
+        if cached is not None:
+            return cached
+
+        if self._graphql_usable:
+            try:
+                data = self._graphql(
+                    _COMMIT_CHECKS_QUERY,
+                    {"owner": self.repo.owner, "name": self.repo.name, "ref": ref},
+                )
+            except GitHubAPIError:
+                self._graphql_usable = False
+            else:
+                # An unknown ref resolves to a null object rather than an error.
+                commit = (data.get("repository") or {}).get("object") or {}
+                return self._commit_contexts(commit)
+
+        # REST fallback: two independent endpoints, fetched concurrently and
+        # reshaped like the GraphQL commit node.
+        def fetch_optional(path: str, jq: str) -> Dict[str, Any]:
+            try:
+                return self._run(path, params=("--jq", jq)) or {}
+            except GitHubAPIError:
+                return {}
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            status_future = executor.submit(fetch_optional, f"commits/{ref}/status", _STATUS_CONTEXTS_JQ)
+            check_runs_future = executor.submit(fetch_optional, f"commits/{ref}/check-runs", _CHECK_RUNS_JQ)
+            status = status_future.result()
+            check_runs = check_runs_future.result()
+
+        suites = []
         for check in check_runs.get("check_runs", []):
-            name = check.get("name")
-            if not name:
-                continue
             app = check.get("app") or {}
-            integration_id = app.get("id")
-            app_slug = app.get("slug")
-            app_name = app.get("name")
-            key = (name, integration_id, app_slug, "check_run")
-            if key in seen:
-                continue
-            seen.add(key)
-            entries.append(
+            suites.append(
                 {
-                    "context": name,
-                    "integration_id": integration_id,
-                    "app_slug": app_slug,
-                    "app_name": app_name,
-                    "type": "check_run",
+                    "app": {"databaseId": app.get("id"), "slug": app.get("slug"), "name": app.get("name")},
+                    "checkRuns": {"nodes": [check]},
                 }
             )
+        commit = {
+            "oid": ref if _COMMIT_SHA_RE.fullmatch(ref) else None,
+            "status": {"contexts": status.get("statuses", [])},
+            "checkSuites": {"nodes": suites},
+        }
+        return self._commit_contexts(commit)
+
+    def batch_check_contexts(
+        self,
+        *,
+        refs: Sequence[str] = (),
+        pr_numbers: Sequence[int] = (),
+        include_default: bool = True,
+        include_latest_pr: bool = False,
+    ) -> CheckContextBatch:
+        """Resolve every requested source and its checks in one GraphQL query.
+
+        The default branch, pull request heads, the latest open (or merged)
+        pull request and arbitrary refs are all selected as aliases of a
+        single document, so the round trip count no longer grows with the
+        number of sources. Commit SHAs whose checks are still in the disk
+        cache are left out of the query. Raises :class:`GitHubAPIError` when
+        GraphQL is not usable; callers then fall back to the per-source REST
+        lookups.
+        """
+        refs = list(dict.fromkeys(refs))
+        pr_numbers = list(dict.fromkeys(pr_numbers))
+        batch = CheckContextBatch()
+        cached_refs: Dict[str, List[CheckContext]] = {}
+        for ref in refs:
+            cached = self._cached_checks(ref)
+            if cached is not None:
+                cached_refs[ref] = cached
+        queried_refs = [ref for ref in refs if ref not in cached_refs]
+        if not (include_default or queried_refs or pr_numbers or include_latest_pr):
+            batch.refs = cached_refs
+            return batch
+
+        declarations = ["$owner: String!", "$name: String!"]
+        variables: Dict[str, Any] = {"owner": self.repo.owner, "name": self.repo.name}
+        selections: List[str] = []
+        if include_default:
+            selections.append("defaultBranch: defaultBranchRef { name target { ...CommitChecks } }")
+        for index, ref in enumerate(queried_refs):
+            declarations.append(f"$ref{index}: String!")
+            variables[f"ref{index}"] = ref
+            selections.append(f"ref{index}: object(expression: $ref{index}) {{ ...CommitChecks }}")
+        for index, number in enumerate(pr_numbers):
+            declarations.append(f"$pr{index}: Int!")
+            variables[f"pr{index}"] = number
+            selections.append(f"pr{index}: pullRequest(number: $pr{index}) {{ ...PullRequestChecks }}")
+        if include_latest_pr:
+            for alias, state in (("latestOpen", "OPEN"), ("latestMerged", "MERGED")):
+                selections.append(
+                    f"{alias}: pullRequests(states: {state}, "
+                    "orderBy: {field: UPDATED_AT, direction: DESC}, first: 1) "
+                    "{ nodes { ...PullRequestChecks } }"
+                )
+
+        fragments = _COMMIT_CHECKS_FRAGMENT
+        if pr_numbers or include_latest_pr:
+            # GraphQL rejects documents with unused fragments.
+            fragments += _PULL_REQUEST_CHECKS_FRAGMENT
+        query = (
+            f"query({', '.join(declarations)}) {{\n"
+            "  repository(owner: $owner, name: $name) {\n    "
+            + "\n    ".join(selections)
+            + "\n  }\n}\n"
+            + fragments
+        )
 
-        entries.sort(key=lambda item: (item["context"], item.get("integration_id") or -1))
-        return entries
+        try:
+            repository = self._graphql(query, variables).get("repository")
+        except GitHubAPIError:
+            self._graphql_usable = False
+            raise
+        if not repository:
+            raise GitHubAPIError(f"Dépôt introuvable via GraphQL : {self.repo.full_name}")
+
+        if include_default:
+            branch = repository.get("defaultBranch") or {}
+            batch.default_branch = branch.get("name")
+            self._default_branch = self._default_branch or batch.default_branch
+            batch.default_contexts = self._commit_contexts(branch.get("target") or {})
+        for index, ref in enumerate(queried_refs):
+            cached_refs[ref] = self._commit_contexts(repository.get(f"ref{index}") or {})
+        batch.refs = {ref: cached_refs[ref] for ref in refs}
+        for index, number in enumerate(pr_numbers):
+            batch.pull_requests[number] = _pull_request_checks(repository.get(f"pr{index}"), self._commit_contexts)
+        if include_latest_pr:
+            for alias in ("latestOpen", "latestMerged"):
+                nodes = (repository.get(alias) or {}).get("nodes") or []
+                if nodes and nodes[0]:
+                    batch.latest_pull_request = _pull_request_checks(nodes[0], self._commit_contexts)
+                    break
+        return batch
+
+
+# gh runs these jq filters before printing, so only the fields read by the
+# callers are transferred to and parsed by Python.
+# The summary is display-ready: every key is present and never null, and
+# updated_at falls back to created_at.
+_RULESET_SUMMARY_JQ = (
+    '[.[] | {id, name: (.name // ""), target: (.target // ""), enforcement: (.enforcement // ""), '
+    'rules_count: ((.rules // []) | length), updated_at: (.updated_at // .created_at // "")}]'
+)
+_STATUS_CONTEXTS_JQ = "{statuses: [.statuses[]? | {context}]}"
+_CHECK_RUNS_JQ = "{check_runs: [.check_runs[]? | {name, app: ((.app // {}) | {id, slug, name})}]}"
+
+_LATEST_OPEN_PR_PATH = "pulls?state=open&sort=updated&direction=desc&per_page=1"
+# One page of 100 covers the same 100 most recently updated closed pull
+# requests the former five pages of 20 did; jq keeps the first merged one.
+_RECENT_CLOSED_PRS_PATH = "pulls?state=closed&sort=updated&direction=desc&per_page=100"
+_FIRST_MERGED_PR_JQ = (
+    "[.[] | select(.merged_at) | {number, title, state, merged_at, head: {sha: .head.sha, ref: .head.ref}}][:1]"
+)
+
+_LATEST_MERGED_PR_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(states: MERGED, orderBy: {field: UPDATED_AT, direction: DESC}, first: 1) {
+      nodes { number title mergedAt headRefOid headRefName }
+    }
+  }
+}
+"""
+
+_COMMIT_CHECKS_FRAGMENT = """
+fragment CommitChecks on Commit {
+  oid
+  status { contexts { context } }
+  checkSuites(first: 50) {
+    nodes {
+      app { databaseId slug name }
+      checkRuns(first: 100) { nodes { name } }
+    }
+  }
+}
+"""
+
+_PULL_REQUEST_CHECKS_FRAGMENT = """
+fragment PullRequestChecks on PullRequest {
+  number
+  state
+  headRefName
+  commits(last: 1) { nodes { commit { ...CommitChecks } } }
+}
+"""
+
+_TEAM_CACHE_TTL = 24 * 60 * 60
+
+_COMMIT_SHA_RE = re.compile(r"[0-9a-f]{40}")
+
+_COMMIT_CHECKS_QUERY = (
+    """
+query($owner: String!, $name: String!, $ref: String!) {
+  repository(owner: $owner, name: $name) {
+    object(expression: $ref) { ...CommitChecks }
+  }
+}
+"""
+    + _COMMIT_CHECKS_FRAGMENT
+)
+
+
+@lru_cache(maxsize=None)
+def gh_executable() -> str:
+    """Absolute path of the gh binary, resolved once per process."""
+
+    return shutil.which("gh") or "gh"
+
+
+class _ETagStore:
+    """Small on-disk map of GET requests to their last ETag and body.
+
+    Updates stay in memory and the file is written once, when the process
+    exits, rather than on every response. Bodies are stored as base64 so a
+    304 replays exactly the bytes that were received.
+    """
+
+    max_entries = 200
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def get(self, key: str) -> Optional[Tuple[str, bytes]]:
+        with self._lock:
+            entry = self._load().get(key)
+        # Entries written before bodies were base64-encoded are ignored.
+        if not entry or "body_base64" not in entry:
+            return None
+        try:
+            return entry["etag"], base64.b64decode(entry["body_base64"])
+        except (binascii.Error, TypeError, ValueError):
+            return None
 
-    def _call_repo_view(self, extra_args: Optional[Iterable[str]] = None) -> str:
-        command = ["gh", "repo", "view", self.repo.full_name]
-        if self.repo.hostname:
-            command.extend(["--hostname", self.repo.hostname])
-        if extra_args:
-            command.extend(extra_args)
+    def put(self, key: str, etag: str, body: bytes) -> None:
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(key)
+            if entry and entry.get("etag") == etag and "body_base64" in entry:
+                return
+            entries[key] = {
+                "etag": etag,
+                "body_base64": base64.b64encode(body).decode("ascii"),
+                "stored_at": time.time(),
+            }
+            self._dirty = True
+
+    def flush(self) -> None:
+        """Write the pending updates, keeping the ``max_entries`` most recent."""
+
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            entries = self._entries
+            if len(entries) > self.max_entries:
+                oldest = sorted(entries, key=lambda name: entries[name].get("stored_at", 0))
+                for name in oldest[: len(entries) - self.max_entries]:
+                    del entries[name]
+            _write_cache_file(self.path, entries)
+            self._dirty = False
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            data = _read_cache_file(self.path)
+            self._entries = {
+                key: entry for key, entry in (data.items() if isinstance(data, dict) else ()) if isinstance(entry, dict)
+            }
+        return self._entries
+
+
+class _InFlight:
+    """A read being fetched by one thread, awaited by the others."""
+
+    __slots__ = ("done", "body", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.body: bytes = b""
+        self.error: Optional[BaseException] = None
+
+    def wait(self) -> bytes:
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.body
+
+
+class _ChecksStore:
+    """On-disk checks observed on commits, one JSON file per SHA.
+
+    A commit keeps gaining checks while its workflows run, so entries are
+    only trusted for ``ttl`` seconds.
+    """
+
+    def __init__(self, directory: Path, ttl: float) -> None:
+        self.directory = directory
+        self.ttl = ttl
+
+    def get(self, sha: str) -> Optional[List[CheckContext]]:
+        data = _read_cache_file(self.directory / f"{sha}.json")
         try:
-            completed = subprocess.run(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                check=True,
-            )
-        except subprocess.CalledProcessError as exc:  # pragma: no cover - interactive flow
-            stderr = exc.stderr.decode("utf-8", errors="replace")
-            raise GitHubAPIError(f"gh repo view a échoué: {stderr}", stderr=stderr) from exc
-        return completed.stdout.decode("utf-8")
+            if time.time() - data["stored_at"] > self.ttl:
+                return None
+            return [CheckContext(*item) for item in data["contexts"]]
+        except (KeyError, TypeError):
+            return None
+
+    def put(self, sha: str, contexts: Sequence[CheckContext]) -> None:
+        data = {
+            "stored_at": time.time(),
+            "contexts": [
+                [item.context, item.integration_id, item.app_slug, item.app_name, item.type] for item in contexts
+            ],
+        }
+        _write_cache_file(self.directory / f"{sha}.json", data)
+
+
+def _read_cache_file(path: Path) -> Any:
+    """Load a JSON cache file, or ``None`` when it is missing or unreadable."""
+
+    try:
+        with path.open("r", encoding="utf-8") as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache_file(path: Path, data: Any) -> None:
+    """Atomically replace a cache file; a cache that cannot be written is simply not persisted."""
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(data, handle, separators=(",", ":"))
+        os.replace(tmp_name, path)
+    except OSError:
+        pass
+
+
+def cache_directory() -> Path:
+    """Directory holding the extension's persistent caches."""
+
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return Path(base) / "gh-ruleset-ext"
+
+
+def _split_included_response(output: bytes) -> Tuple[Optional[int], Optional[str], bytes]:
+    """Split `gh api --include` output into status code, ETag and body."""
+
+    head, separator, body = output.partition(b"\r\n\r\n")
+    if not separator:
+        return None, None, output
+
+    lines = head.decode("latin-1").splitlines()
+    status: Optional[int] = None
+    if lines:
+        parts = lines[0].split()
+        if len(parts) > 1 and parts[1].isdigit():
+            status = int(parts[1])
+    etag: Optional[str] = None
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        if name.strip().lower() == "etag":
+            etag = value.strip()
+    return status, etag, body
+
+
+def _is_blank(output: bytes) -> bool:
+    return not output or output.isspace()
+
+
+def _parse_json_output(stdout: bytes, method: str, path: str) -> Any:
+    if _is_blank(stdout):
+        return None
+
+    # json.loads detects the encoding of bytes itself; no str copy needed.
+    try:
+        return json.loads(stdout)
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+        stdout_text = stdout.decode("utf-8", errors="replace")
+        raise GitHubAPIError(
+            f"Réponse JSON invalide pour {method} {path}: {stdout_text}",
+        ) from exc
+
+
+def _check_contexts_from_commit(commit: Dict[str, Any]) -> List[CheckContext]:
+    """Build the sorted, de-duplicated check entries of a GraphQL commit node."""
+
+    # The app slug and name follow from the integration ID, so they are left
+    # out of the dedup key; the dict keeps first-seen order.
+    entries: Dict[Tuple[str, str, Optional[int]], CheckContext] = {}
+
+    for status_obj in (commit.get("status") or {}).get("contexts") or []:
+        context = status_obj.get("context")
+        if context and ("status", context, None) not in entries:
+            entries["status", context, None] = CheckContext(context, None, None, None, "status")
+
+    for suite in (commit.get("checkSuites") or {}).get("nodes") or []:
+        app = suite.get("app") or {}
+        # GraphQL's App.databaseId is the REST integration ID.
+        integration_id = app.get("databaseId")
+        app_slug = app.get("slug")
+        app_name = app.get("name")
+        for check in (suite.get("checkRuns") or {}).get("nodes") or []:
+            name = check.get("name")
+            key = ("check_run", name, integration_id)
+            if name and key not in entries:
+                entries[key] = CheckContext(name, integration_id, app_slug, app_name, "check_run")
+
+    return sorted(entries.values(), key=lambda item: (item.context, item.integration_id or -1))
+
+
+def _pull_request_checks(
+    node: Optional[Dict[str, Any]],
+    contexts_of: Callable[[Dict[str, Any]], List[CheckContext]] = _check_contexts_from_commit,
+) -> Optional[PullRequestChecks]:
+    """Convert a ``PullRequestChecks`` fragment, or ``None`` when unresolved."""
+
+    if not node or node.get("number") is None:
+        return None
+    # The last commit of a pull request is its head commit.
+    commits = (node.get("commits") or {}).get("nodes") or []
+    commit = (commits[-1] or {}).get("commit") if commits else None
+    return PullRequestChecks(
+        number=node["number"],
+        head_ref=node.get("headRefName"),
+        merged=node.get("state") == "MERGED",
+        contexts=contexts_of(commit or {}),
+    )
+
+
+def _is_enterprise_host(host: str) -> bool:
+    """Mirror gh's rule for picking GH_ENTERPRISE_TOKEN over GH_TOKEN."""
+
+    host = host.lower()
+    if host in {"github.com", "api.github.com", "github.localhost"}:
+        return False
+    return not host.endswith(".ghe.com")
@@ -2,25 +2,36 @@ from __future__ import annotations
 
 import argparse
 import json
+import re
 import sys
-from copy import deepcopy
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from functools import partial
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
 
-from .api import GitHubAPI, GitHubAPIError
+from .api import CheckContext, CheckContextBatch, GitHubAPI, GitHubAPIError
 from .prompts import (
     open_editor_with_json,
+    parse_number,
     prompt_choice,
     prompt_multi_value,
     prompt_string,
     prompt_yes_no,
 )
 from .utils import resolve_repository
-from .validation import validate_ruleset_payload
-from .i18n import translate as _, set_language, language_from_env, available_languages
+from .i18n import (
+    available_languages,
+    language_from_env,
+    set_language,
+    translate as _,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
 
 
-ENFORCEMENT_CHOICES = ["disabled", "evaluate", "active"]
-TARGET_CHOICES = ["branch", "tag", "push"]
+ENFORCEMENT_CHOICES = ("disabled", "evaluate", "active")
+_LANGUAGE_CHOICES = tuple(sorted(available_languages()))
+TARGET_CHOICES = ("branch", "tag", "push")
 
 DEFAULT_BRANCH_TOKEN = "~DEFAULT_BRANCH"
 DEFAULT_BRANCH_REF = f"refs/heads/{DEFAULT_BRANCH_TOKEN}"
@@ -33,20 +44,31 @@ GENERIC_RULE_EDITOR_HEADER = (
 
 
 def main(argv: Optional[List[str]] = None) -> None:
-    set_language(language_from_env())
-    parser = build_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    # Applied before parsing so that --help and usage errors use it too;
+    # argparse then only checks that the --lang value is a known language.
+    set_language(_language_option(argv) or language_from_env())
+    parser = build_parser(argv)
     args = parser.parse_args(argv)
-
-    set_language(getattr(args, "lang", None) or language_from_env())
-
-    if not hasattr(args, "handler"):
-        parser.print_help()
-        return
+    # argparse also accepts abbreviations such as --lan, which the early
+    # lookup does not see: the parsed value decides for the rest of the run.
+    set_language(args.lang or language_from_env())
+
+    command: Any = args.command
+    nested = _NESTED_COMMANDS.get(command)
+    if nested is not None:
+        command = (command, getattr(args, nested[0]))
+    handler = _HANDLERS.get(command)
+    if handler is None:
+        # No command, or a command group without its subcommand: show the
+        # help of the deepest command given (exits).
+        parser.parse_args([*argv, "--help"])
 
     try:
         repo = resolve_repository(args.repo)
-        api = GitHubAPI(repo)
-        args.handler(api, args)
+        api = GitHubAPI(repo, disk_cache=not args.no_cache)
+        handler(api, args)
     except KeyboardInterrupt:
         print(_("error_keyboard_interrupt", "\nInterrupted by user (Ctrl+C)."), file=sys.stderr)
         sys.exit(130)
@@ -60,7 +82,36 @@ def main(argv: Optional[List[str]] = None) -> None:
         sys.exit(1)
 
 
-def build_parser() -> argparse.ArgumentParser:
+def _language_option(argv: Sequence[str]) -> Optional[str]:
+    for index, arg in enumerate(argv):
+        if arg == "--lang" and index + 1 < len(argv):
+            return argv[index + 1]
+        if arg.startswith("--lang="):
+            return arg.partition("=")[2]
+    return None
+
+
+def build_parser(argv: Optional[Sequence[str]] = None) -> argparse.ArgumentParser:
+    if argv is None:
+        argv = sys.argv[1:]
+    return _build_parser(_invoked_commands(argv))
+
+
+def _invoked_commands(argv: Sequence[str]) -> Tuple[str, ...]:
+    """Command names found in ``argv``, outermost first (e.g. ``("rule", "edit")``)."""
+    invoked: List[str] = []
+    commands: Optional[Sequence[_CommandEntry]] = _COMMANDS
+    for arg in argv:
+        if commands is None:
+            break
+        if any(entry[0] == arg for entry in commands):
+            invoked.append(arg)
+            nested = _NESTED_COMMANDS.get(arg)
+            commands = nested[1] if nested else None
+    return tuple(invoked)
+
+
+def _build_parser(invoked: Sequence[str]) -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="gh ruleset-ext",
         description=_("cli_description", "Manage repository rulesets."),
@@ -74,68 +125,91 @@ def build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--lang",
-        choices=sorted(available_languages().keys()),
+        choices=_LANGUAGE_CHOICES,
         help=_("arg_lang_help", "Interface language (default: English)."),
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=_("arg_no_cache_help", "Ignore and do not update the on-disk caches."),
+    )
 
-    subparsers = parser.add_subparsers(dest="command")
+    _add_commands(parser, "command", _COMMANDS, invoked)
+    return parser
 
-    list_parser = subparsers.add_parser(
-        "list",
-        help=_("command_list_help", "List repository rulesets."),
-    )
-    list_parser.add_argument(
+
+def _add_commands(
+    parser: argparse.ArgumentParser,
+    dest: str,
+    commands: Sequence[_CommandEntry],
+    invoked: Sequence[str],
+) -> None:
+    # Every command is registered so the help lists them all, but only the
+    # invoked one gets its arguments, and so on down nested subcommands.
+    subparsers = parser.add_subparsers(dest=dest)
+    for name, help_key, help_default, add_arguments in commands:
+        subparser = subparsers.add_parser(name, help=_(help_key, help_default))
+        if invoked and name == invoked[0]:
+            add_arguments(subparser)
+            if name in _NESTED_COMMANDS:
+                nested_dest, nested = _NESTED_COMMANDS[name]
+                _add_commands(subparser, nested_dest, nested, invoked[1:])
+
+
+def _add_list_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--json",
         action="store_true",
         help=_("option_json_output", "Return raw JSON."),
     )
-    list_parser.set_defaults(handler=handle_list)
-
-    view_parser = subparsers.add_parser(
-        "view",
-        help=_("command_view_help", "View a specific ruleset."),
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help=_("option_json_compact", "With --json, print the JSON on one line without indentation."),
     )
-    view_parser.add_argument(
+
+
+def _add_view_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "ruleset_id",
         type=int,
         help=_("arg_ruleset_id", "Numeric ruleset identifier."),
     )
-    view_parser.add_argument(
+    parser.add_argument(
         "--json",
         action="store_true",
         help=_("option_json_output", "Return raw JSON."),
     )
-    view_parser.set_defaults(handler=handle_view)
-
-    delete_parser = subparsers.add_parser(
-        "delete",
-        help=_("command_delete_help", "Delete a ruleset."),
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help=_("option_json_compact", "With --json, print the JSON on one line without indentation."),
     )
-    delete_parser.add_argument(
+
+
+def _add_delete_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "ruleset_id",
         type=int,
         help=_("arg_ruleset_id", "Numeric ruleset identifier."),
     )
-    delete_parser.add_argument(
+    parser.add_argument(
         "-y",
         "--yes",
         action="store_true",
         help=_("option_yes_help", "Auto-confirm (non-interactive)."),
     )
-    delete_parser.set_defaults(handler=handle_delete)
 
-    create_parser = subparsers.add_parser(
-        "create",
-        help=_("command_create_help", "Create a new ruleset."),
-    )
-    create_parser.add_argument(
+
+def _add_create_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--file",
         help=_(
             "option_file_help",
             "Pre-filled JSON file for creation. Otherwise an interactive wizard is used.",
         ),
     )
-    create_parser.add_argument(
+    parser.add_argument(
         "--from-existing",
         type=int,
         help=_(
@@ -143,7 +217,7 @@ def build_parser() -> argparse.ArgumentParser:
             "Clone an existing ruleset before interactive changes.",
         ),
     )
-    create_parser.add_argument(
+    parser.add_argument(
         "--editor",
         action="store_true",
         help=_(
@@ -151,7 +225,7 @@ def build_parser() -> argparse.ArgumentParser:
             "Open final JSON in editor before submission.",
         ),
     )
-    create_parser.add_argument(
+    parser.add_argument(
         "--skip-validate",
         action="store_true",
         help=_(
@@ -159,25 +233,38 @@ def build_parser() -> argparse.ArgumentParser:
             "Skip local payload validation against the OpenAPI schema.",
         ),
     )
-    create_parser.set_defaults(handler=handle_create)
-
-    update_parser = subparsers.add_parser(
-        "update",
-        help=_("command_update_help", "Update an existing ruleset."),
+    parser.add_argument(
+        "--bypass-spec",
+        metavar="FILE",
+        help=_(
+            "option_bypass_spec_help",
+            "JSON file listing the bypass actors; replaces the interactive bypass prompts.",
+        ),
+    )
+    parser.add_argument(
+        "--no-prompt",
+        action="store_true",
+        help=_(
+            "option_no_prompt_help",
+            "Never prompt (for scripts): requires --file and aborts on validation errors.",
+        ),
     )
-    update_parser.add_argument(
+
+
+def _add_update_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "ruleset_id",
         type=int,
         help=_("arg_ruleset_id", "Numeric ruleset identifier."),
     )
-    update_parser.add_argument(
+    parser.add_argument(
         "--file",
         help=_(
             "option_update_file_help",
             "JSON file to replace the ruleset. Otherwise use the interactive wizard.",
         ),
     )
-    update_parser.add_argument(
+    parser.add_argument(
         "--editor",
         action="store_true",
         help=_(
@@ -185,7 +272,7 @@ def build_parser() -> argparse.ArgumentParser:
             "Open final JSON in editor before submission.",
         ),
     )
-    update_parser.add_argument(
+    parser.add_argument(
         "--skip-validate",
         action="store_true",
         help=_(
@@ -193,13 +280,26 @@ def build_parser() -> argparse.ArgumentParser:
             "Skip local payload validation against the OpenAPI schema.",
         ),
     )
-    update_parser.set_defaults(handler=handle_update)
-
-    rule_parser = subparsers.add_parser(
-        "rule",
-        help=_("command_rule_help", "Manage individual rules within a ruleset."),
+    parser.add_argument(
+        "--bypass-spec",
+        metavar="FILE",
+        help=_(
+            "option_bypass_spec_help",
+            "JSON file listing the bypass actors; replaces the interactive bypass prompts.",
+        ),
     )
-    rule_parser.add_argument(
+    parser.add_argument(
+        "--no-prompt",
+        action="store_true",
+        help=_(
+            "option_no_prompt_help",
+            "Never prompt (for scripts): requires --file and aborts on validation errors.",
+        ),
+    )
+
+
+def _add_rule_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--skip-validate",
         action="store_true",
         help=_(
@@ -207,70 +307,66 @@ def build_parser() -> argparse.ArgumentParser:
             "Skip local validation when modifying the ruleset.",
         ),
     )
-    rule_sub = rule_parser.add_subparsers(dest="rule_command")
 
-    rule_list = rule_sub.add_parser(
-        "list",
-        help=_("command_rules_list_help", "List rules inside a ruleset."),
-    )
-    rule_list.add_argument("ruleset_id", type=int)
-    rule_list.set_defaults(handler=handle_rule_list)
 
-    rule_add = rule_sub.add_parser(
-        "add",
-        help=_("command_rules_add_help", "Add a rule to a ruleset."),
-    )
-    rule_add.add_argument("ruleset_id", type=int)
-    rule_add.set_defaults(handler=handle_rule_add)
+def _add_rule_list_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("ruleset_id", type=int)
 
-    rule_edit = rule_sub.add_parser(
-        "edit",
-        help=_("command_rules_edit_help", "Edit an existing rule."),
-    )
-    rule_edit.add_argument("ruleset_id", type=int)
-    rule_edit.add_argument(
+
+def _add_rule_edit_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("ruleset_id", type=int)
+    parser.add_argument(
         "rule_index",
         type=int,
         help=_("arg_rule_index", "Rule index (1-based)."),
     )
-    rule_edit.set_defaults(handler=handle_rule_edit)
 
-    rule_delete = rule_sub.add_parser(
-        "delete",
-        help=_("command_rules_delete_help", "Delete a rule from a ruleset."),
+
+def _add_rule_batch_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("ruleset_id", type=int)
+    parser.add_argument(
+        "file",
+        help=_(
+            "arg_rule_batch_file",
+            'JSON array of operations: {{"op": "add", "rule": {{...}}}}, '
+            '{{"op": "edit", "index": N, "rule": {{...}}}} or {{"op": "delete", "index": N}}.',
+        ),
     )
-    rule_delete.add_argument("ruleset_id", type=int)
-    rule_delete.add_argument(
-        "rule_index",
-        type=int,
-        help=_("arg_rule_index", "Rule index (1-based)."),
+    parser.add_argument(
+        "--no-prompt",
+        action="store_true",
+        help=_(
+            "option_rule_batch_no_prompt_help",
+            "Never prompt (for scripts): abort on validation errors instead of asking whether to continue.",
+        ),
     )
-    rule_delete.add_argument(
+
+
+def _add_rule_delete_arguments(parser: argparse.ArgumentParser) -> None:
+    _add_rule_edit_arguments(parser)
+    parser.add_argument(
         "-y",
         "--yes",
         action="store_true",
         help=_("option_rules_delete_confirm_help", "Auto-confirm (non-interactive)."),
     )
-    rule_delete.set_defaults(handler=handle_rule_delete)
 
-    contexts_parser = subparsers.add_parser(
-        "checks",
-        help=_("command_checks_help", "List recently observed checks."),
-    )
-    contexts_parser.add_argument(
+
+def _add_checks_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--ref",
         help=_(
             "option_checks_ref_help",
             "Reference (branch or SHA) used to inspect checks. Defaults to the default branch.",
         ),
     )
-    contexts_parser.add_argument(
+    parser.add_argument(
         "--pr",
         type=int,
         action="append",
         help=_("option_checks_pr_help", "Pull request number to include (repeatable)."),
     )
-    contexts_parser.add_argument(
+    parser.add_argument(
         "--latest-pr",
         action="store_true",
         help=_(
@@ -278,7 +374,7 @@ def build_parser() -> argparse.ArgumentParser:
             "Automatically include the most recent open PR.",
         ),
     )
-    contexts_parser.add_argument(
+    parser.add_argument(
         "--no-default",
         action="store_true",
         help=_(
@@ -286,18 +382,48 @@ def build_parser() -> argparse.ArgumentParser:
             "Do not inspect the default branch commit.",
         ),
     )
-    contexts_parser.set_defaults(handler=handle_checks_list)
 
-    return parser
+
+# Name, help translation key, default help and argument builder.
+_CommandEntry = Tuple[str, str, str, Callable[[argparse.ArgumentParser], None]]
+
+_COMMANDS: Tuple[_CommandEntry, ...] = (
+    ("list", "command_list_help", "List repository rulesets.", _add_list_arguments),
+    ("view", "command_view_help", "View a specific ruleset.", _add_view_arguments),
+    ("delete", "command_delete_help", "Delete a ruleset.", _add_delete_arguments),
+    ("create", "command_create_help", "Create a new ruleset.", _add_create_arguments),
+    ("update", "command_update_help", "Update an existing ruleset.", _add_update_arguments),
+    ("rule", "command_rule_help", "Manage individual rules within a ruleset.", _add_rule_arguments),
+    ("checks", "command_checks_help", "List recently observed checks.", _add_checks_arguments),
+)
+_RULE_COMMANDS: Tuple[_CommandEntry, ...] = (
+    ("list", "command_rules_list_help", "List rules inside a ruleset.", _add_rule_list_arguments),
+    ("add", "command_rules_add_help", "Add a rule to a ruleset.", _add_rule_list_arguments),
+    ("edit", "command_rules_edit_help", "Edit an existing rule.", _add_rule_edit_arguments),
+    ("delete", "command_rules_delete_help", "Delete a rule from a ruleset.", _add_rule_delete_arguments),
+    (
+        "batch",
+        "command_rules_batch_help",
+        "Apply several rule changes from a file with a single update.",
+        _add_rule_batch_arguments,
+    ),
+)
+# Commands with subcommands of their own: destination attribute and table.
+_NESTED_COMMANDS: Dict[str, Tuple[str, Tuple[_CommandEntry, ...]]] = {
+    "rule": ("rule_command", _RULE_COMMANDS),
+}
 
 
 # ---------------------------------------------------------------------------
 # Validation helpers
 
 
-def ensure_payload_is_valid(payload: Dict[str, Any], *, skip: bool, action: str) -> bool:
-    if skip:
-        return True
+def ensure_payload_is_valid(payload: Dict[str, Any], *, action: str, interactive: bool = True) -> bool:
+    # Callers test --skip-validate themselves, so skipping costs no call and
+    # no translation of the action label.
+    # The schema is only loaded by commands that validate; the module cache
+    # keeps it parsed for any later validation in the same run.
+    from .validation import validate_ruleset_payload
 
     errors = validate_ruleset_payload(payload)
     if not errors:
@@ -307,28 +433,41 @@ def ensure_payload_is_valid(payload: Dict[str, Any], *, skip: bool, action: str)
     for error in errors:
         print(f"- {error}")
 
+    cancelled = _("validation_cancelled", "{action} cancelled.", action=action.capitalize())
+    if not interactive:
+        # Scripts get a non-zero exit status instead of a question.
+        raise RuntimeError(cancelled)
     if prompt_yes_no(
         _("validation_continue", "Continue {action} anyway?", action=action),
         default=False,
     ):
         return True
 
-    print(_("validation_cancelled", "{action} cancelled.", action=action.capitalize()))
+    print(cancelled)
     return False
 
 
+def check_no_prompt_arguments(args: argparse.Namespace) -> None:
+    """Reject option combinations that would prompt despite ``--no-prompt``."""
+    if args.no_prompt and (not args.file or args.editor):
+        raise RuntimeError(
+            _(
+                "error_no_prompt_arguments",
+                "--no-prompt requires --file and cannot be combined with --editor.",
+            )
+        )
+
+
 # ---------------------------------------------------------------------------
 # Basic commands
 
 
+_LIST_ROW = itemgetter("id", "name", "target", "enforcement", "rules_count", "updated_at")
+
+
 def handle_list(api: GitHubAPI, args: argparse.Namespace) -> None:
-    rulesets = api.list_rulesets() or []
     if args.json:
-        print(json.dumps(rulesets, indent=2))
-        return
-
-    if not rulesets:
-        print(_("list_no_rulesets", "No rulesets in this repository."))
+        print_json(api.list_rulesets(), compact=args.compact)
         return
 
     headers = [
@@ -339,25 +478,19 @@ def handle_list(api: GitHubAPI, args: argparse.Namespace) -> None:
         _("table_header_rules", "Rules"),
         _("table_header_updated", "Updated"),
     ]
-    rows = []
-    for item in rulesets:
-        rows.append(
-            [
-                str(item.get("id", "")),
-                item.get("name", ""),
-                item.get("target", ""),
-                item.get("enforcement", ""),
-                str(len(item.get("rules", []) or [])),
-                item.get("updated_at", "") or item.get("created_at", ""),
-            ]
-        )
+    # Rows are built as pages arrive from summaries trimmed by gh itself; the
+    # rulesets themselves are never fetched in full.
+    rows = list(map(_LIST_ROW, api.iter_ruleset_summaries()))
+    if not rows:
+        print(_("list_no_rulesets", "No rulesets in this repository."))
+        return
     print_table(headers, rows)
 
 
 def handle_view(api: GitHubAPI, args: argparse.Namespace) -> None:
     ruleset = api.get_ruleset(args.ruleset_id)
     if args.json:
-        print(json.dumps(ruleset, indent=2))
+        print_json(ruleset, compact=args.compact)
         return
 
     print_ruleset_details(ruleset)
@@ -387,22 +520,26 @@ def handle_delete(api: GitHubAPI, args: argparse.Namespace) -> None:
 
 
 def handle_create(api: GitHubAPI, args: argparse.Namespace) -> None:
+    check_no_prompt_arguments(args)
+    bypass_actors = load_bypass_spec(api, args.bypass_spec) if args.bypass_spec else None
     if args.file:
         payload = load_json_file(args.file)
+        if bypass_actors is not None:
+            payload["bypass_actors"] = bypass_actors
     else:
         template: Optional[Dict[str, Any]] = None
         if args.from_existing:
             existing = api.get_ruleset(args.from_existing)
-            template = prepare_ruleset_payload(existing)
-        payload = interactive_ruleset_builder(api, template)
+            template = prepare_ruleset_payload(existing, clone=True)
+        payload = interactive_ruleset_builder(api, template, bypass_actors=bypass_actors)
 
     if args.editor:
         payload = open_editor_with_json(payload)
 
-    if not ensure_payload_is_valid(
+    if not args.skip_validate and not ensure_payload_is_valid(
         payload,
-        skip=args.skip_validate,
         action=_("action_creation", "creation"),
+        interactive=not args.no_prompt,
     ):
         return
 
@@ -417,19 +554,27 @@ def handle_create(api: GitHubAPI, args: argparse.Namespace) -> None:
 
 
 def handle_update(api: GitHubAPI, args: argparse.Namespace) -> None:
+    check_no_prompt_arguments(args)
+    bypass_actors = load_bypass_spec(api, args.bypass_spec) if args.bypass_spec else None
     if args.file:
         payload = load_json_file(args.file)
+        if bypass_actors is not None:
+            payload["bypass_actors"] = bypass_actors
     else:
         existing = api.get_ruleset(args.ruleset_id)
-        payload = interactive_ruleset_builder(api, prepare_ruleset_payload(existing))
+        payload = interactive_ruleset_builder(
+            api,
+            prepare_ruleset_payload(existing, clone=True),
+            bypass_actors=bypass_actors,
+        )
 
     if args.editor:
         payload = open_editor_with_json(payload)
 
-    if not ensure_payload_is_valid(
+    if not args.skip_validate and not ensure_payload_is_valid(
         payload,
-        skip=args.skip_validate,
         action=_("action_update", "update"),
+        interactive=not args.no_prompt,
     ):
         return
 
@@ -453,9 +598,11 @@ def handle_rule_list(api: GitHubAPI, args: argparse.Namespace) -> None:
     if not rules:
         print(_("rule_list_empty", "This ruleset does not contain any rules."))
         return
-    for idx, rule in enumerate(rules, start=1):
-        summary = summarize_rule(rule)
-        print(_("rule_list_entry", "[{index}] {summary}", index=idx, summary=summary))
+    lines = [
+        _("rule_list_entry", "[{index}] {summary}", index=idx, summary=summarize_rule(rule))
+        for idx, rule in enumerate(rules, start=1)
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def handle_rule_add(api: GitHubAPI, args: argparse.Namespace) -> None:
@@ -464,18 +611,18 @@ def handle_rule_add(api: GitHubAPI, args: argparse.Namespace) -> None:
     payload["rules"] = manage_rules_interactively(
         api, payload.get("rules", []), action="add"
     )
-    if not ensure_payload_is_valid(
+    if not args.skip_validate and not ensure_payload_is_valid(
         payload,
-        skip=getattr(args, "skip_validate", False),
         action=_("action_rule_add", "adding the rule"),
     ):
         return
-    updated = api.update_ruleset(args.ruleset_id, payload)
+    # The summary comes from the payload just sent, not from the response.
+    api.update_ruleset(args.ruleset_id, payload, return_body=False)
     print(
         _(
             "rule_added",
             "Rule added. The ruleset now contains {count} rules.",
-            count=len(updated.get("rules", [])),
+            count=len(payload["rules"]),
         )
     )
 
@@ -488,19 +635,18 @@ def handle_rule_edit(api: GitHubAPI, args: argparse.Namespace) -> None:
     if index < 0 or index >= len(rules):
         raise RuntimeError(_("error_rule_index", "Invalid rule index."))
     rules[index] = edit_rule_interactively(api, rules[index])
-    if not ensure_payload_is_valid(
+    if not args.skip_validate and not ensure_payload_is_valid(
         payload,
-        skip=getattr(args, "skip_validate", False),
         action=_("action_rule_update", "updating the rule"),
     ):
         return
-    updated = api.update_ruleset(args.ruleset_id, payload)
+    api.update_ruleset(args.ruleset_id, payload, return_body=False)
     print(
         _(
             "rule_updated",
             "Rule {index} updated. ({summary})",
             index=args.rule_index,
-            summary=summary_for_rule(updated["rules"][index]),
+            summary=summarize_rule(rules[index]),
         )
     )
 
@@ -526,13 +672,12 @@ def handle_rule_delete(api: GitHubAPI, args: argparse.Namespace) -> None:
             print(_("prompt_delete_cancelled", "Deletion cancelled."))
             return
     removed = rules.pop(index)
-    if not ensure_payload_is_valid(
+    if not args.skip_validate and not ensure_payload_is_valid(
         payload,
-        skip=getattr(args, "skip_validate", False),
         action=_("action_rule_delete", "deleting the rule"),
     ):
         return
-    api.update_ruleset(args.ruleset_id, payload)
+    api.update_ruleset(args.ruleset_id, payload, return_body=False)
     print(
         _(
             "rule_deleted",
@@ -542,10 +687,68 @@ def handle_rule_delete(api: GitHubAPI, args: argparse.Namespace) -> None:
     )
 
 
+def handle_rule_batch(api: GitHubAPI, args: argparse.Namespace) -> None:
+    operations = load_json_file(args.file)
+    if not isinstance(operations, list):
+        raise RuntimeError(_("rule_batch_not_list", "The rule operations file must be a JSON array."))
+    existing = api.get_ruleset(args.ruleset_id)
+    payload = prepare_ruleset_payload(existing)
+    payload["rules"] = apply_rule_operations(payload.get("rules", []), operations)
+    if not args.skip_validate and not ensure_payload_is_valid(
+        payload,
+        action=_("action_rule_batch", "applying the rule changes"),
+        interactive=not args.no_prompt,
+    ):
+        return
+    # One read and one write whatever the number of operations.
+    api.update_ruleset(args.ruleset_id, payload, return_body=False)
+    print(
+        _(
+            "rule_batch_applied",
+            "{count} rule changes applied. The ruleset now contains {total} rules.",
+            count=len(operations),
+            total=len(payload["rules"]),
+        )
+    )
+
+
+def apply_rule_operations(rules: List[Dict[str, Any]], operations: List[Any]) -> List[Dict[str, Any]]:
+    """Apply add/edit/delete operations in order and return the new rule list.
+
+    Indexes are 1-based positions in the list as it stands when each
+    operation runs, like ``rule edit`` and ``rule delete`` run one by one.
+    """
+    rules = list(rules)
+    for number, operation in enumerate(operations, start=1):
+        op = operation.get("op") if isinstance(operation, dict) else None
+        rule = operation.get("rule") if op in ("add", "edit") else None
+        index = operation.get("index") if op in ("edit", "delete") else None
+        in_range = isinstance(index, int) and not isinstance(index, bool) and 1 <= index <= len(rules)
+        if op == "add" and isinstance(rule, dict):
+            rules.append(rule)
+        elif op == "edit" and in_range and isinstance(rule, dict):
+            rules[index - 1] = rule
+        elif op == "delete" and in_range:
+            del rules[index - 1]
+        else:
+            raise RuntimeError(
+                _(
+                    "rule_batch_invalid_operation",
+                    'Rule operation {number}: expected "add" with a rule, or "edit"/"delete" with a valid index.',
+                    number=number,
+                )
+            )
+    return rules
+
+
 # ---------------------------------------------------------------------------
 # Checks helper
 
 
+# Sorted by name so expanded kind lists come out in order.
+_CHECK_KIND_BITS = {"check_run": 1, "status": 2}
+
+
 def collect_check_contexts(
     api: GitHubAPI,
     *,
@@ -554,151 +757,240 @@ def collect_check_contexts(
     prs: Optional[Sequence[int]] = None,
     include_latest_pr: bool = False,
 ) -> Tuple[List[Dict[str, Any]], List[str], List[str]]:
-    contexts_map: Dict[Tuple[str, Optional[int]], Dict[str, Any]] = {}
+    # Kinds and sources are accumulated as bitmasks: bit N of "sources" stands
+    # for inspected_sources[N]. They are expanded to sorted lists at the end.
+    # Keys are (context, integration ID or -1), which is also the output order.
+    contexts_map: Dict[Tuple[str, int], Dict[str, Any]] = {}
     inspected_sources: List[str] = []
-    seen_sources: set[str] = set()
+    source_bits: Dict[str, int] = {}
     warnings: List[str] = []
 
-    def record_contexts(ref_value: str, label: str) -> None:
-        try:
-            contexts = api.list_check_contexts(ref_value)
-        except GitHubAPIError as exc:
-            warnings.append(f"{label}: {exc}")
-            if exc.stderr:
-                warnings.append(exc.stderr.strip())
-            return
+    def add_contexts(contexts: Sequence[CheckContext], label: str) -> None:
         if not contexts:
             return
-        if label not in seen_sources:
+        source_bit = source_bits.get(label)
+        if source_bit is None:
+            source_bit = source_bits[label] = 1 << len(inspected_sources)
             inspected_sources.append(label)
-            seen_sources.add(label)
         for ctx in contexts:
-            key = (ctx["context"], ctx.get("integration_id"))
+            key = (ctx.context, ctx.integration_id or -1)
             data = contexts_map.setdefault(
                 key,
                 {
-                    "context": ctx["context"],
-                    "integration_id": ctx.get("integration_id"),
-                    "app_slug": ctx.get("app_slug"),
-                    "app_name": ctx.get("app_name"),
-                    "kinds": set(),
-                    "sources": set(),
+                    "context": ctx.context,
+                    "integration_id": ctx.integration_id,
+                    "app_slug": ctx.app_slug,
+                    "app_name": ctx.app_name,
+                    "kinds": 0,
+                    "sources": 0,
                 },
             )
-            if ctx.get("app_slug") and not data.get("app_slug"):
-                data["app_slug"] = ctx["app_slug"]
-            if ctx.get("app_name") and not data.get("app_name"):
-                data["app_name"] = ctx["app_name"]
-            if ctx.get("type"):
-                data["kinds"].add(ctx["type"])
-            data["sources"].add(label)
-
-    if include_default:
-        try:
-            branch = api.get_default_branch()
-            sha = api.get_latest_commit_sha(branch)
-            record_contexts(sha, f"default:{branch}")
-        except GitHubAPIError as exc:
-            warnings.append(
-                _(
-                    "warning_default_branch",
-                    "Default branch: {error}",
-                    error=exc,
-                )
-            )
-            if exc.stderr:
-                warnings.append(exc.stderr.strip())
-
-    if refs:
-        for ref in refs:
-            if ref:
-                record_contexts(ref, ref)
-
-    if prs:
-        for number in prs:
-            try:
-                sha, ref_name = api.get_pull_request_head_sha(number)
-            except GitHubAPIError as exc:
+            if ctx.app_slug and not data.get("app_slug"):
+                data["app_slug"] = ctx.app_slug
+            if ctx.app_name and not data.get("app_name"):
+                data["app_name"] = ctx.app_name
+            data["kinds"] |= _CHECK_KIND_BITS.get(ctx.type, 0)
+            data["sources"] |= source_bit
+
+    def pull_request_label(number: int, ref_name: Optional[str]) -> str:
+        label = f"pr#{number}"
+        if ref_name:
+            label += f" ({ref_name})"
+        return label
+
+    # One GraphQL query resolves every source and its checks; the per-source
+    # REST lookups below only run when GraphQL is not usable.
+    try:
+        batch: Optional[CheckContextBatch] = api.batch_check_contexts(
+            refs=[ref for ref in refs or () if ref],
+            pr_numbers=list(prs or ()),
+            include_default=include_default,
+            include_latest_pr=include_latest_pr,
+        )
+    except GitHubAPIError:
+        batch = None
+
+    if batch is not None:
+        if include_default:
+            if batch.default_branch:
+                add_contexts(batch.default_contexts, f"default:{batch.default_branch}")
+            else:
                 warnings.append(
                     _(
-                        "warning_pr_specific",
-                        "PR #{number}: {error}",
-                        number=number,
-                        error=exc,
+                        "warning_default_branch_missing",
+                        "Default branch: unable to determine the repository's default branch.",
                     )
                 )
-                if exc.stderr:
-                    warnings.append(exc.stderr.strip())
-                continue
-            label = f"pr#{number}"
-            if ref_name:
-                label += f" ({ref_name})"
-            record_contexts(sha, label)
-
-    if include_latest_pr:
-        latest = None
-        try:
-            latest = api.get_latest_open_pull_request()
-        except GitHubAPIError as exc:
-            warnings.append(
-                _(
-                    "warning_latest_open_pr",
-                    "Latest open PR: {error}",
-                    error=exc,
-                )
-            )
-            if exc.stderr:
-                warnings.append(exc.stderr.strip())
-        if not latest:
-            try:
-                latest = api.get_latest_merged_pull_request()
-            except GitHubAPIError as exc:
+        for ref, contexts in batch.refs.items():
+            add_contexts(contexts, ref)
+        for number, pull_request in batch.pull_requests.items():
+            if pull_request is None:
                 warnings.append(
                     _(
-                        "warning_latest_merged_pr",
-                        "Latest merged PR: {error}",
-                        error=exc,
+                        "warning_pr_not_found",
+                        "PR #{number}: pull request not found.",
+                        number=number,
                     )
                 )
-                if exc.stderr:
-                    warnings.append(exc.stderr.strip())
-                latest = None
-        if latest:
-            sha = latest.get("head", {}).get("sha")
-            if sha:
-                number = latest.get("number")
-                ref_name = latest.get("head", {}).get("ref")
-                label = f"pr#{number}"
-                if ref_name:
-                    label += f" ({ref_name})"
-                if latest.get("merged_at") and latest.get("state") != "open":
+                continue
+            add_contexts(pull_request.contexts, pull_request_label(number, pull_request.head_ref))
+        if include_latest_pr:
+            latest_pr = batch.latest_pull_request
+            if latest_pr:
+                label = pull_request_label(latest_pr.number, latest_pr.head_ref)
+                if latest_pr.merged:
                     label += " [merged]"
-                record_contexts(sha, label)
+                add_contexts(latest_pr.contexts, label)
             else:
                 warnings.append(
                     _(
-                        "warning_latest_pr_no_sha",
-                        "Latest PR: unable to determine head SHA.",
+                        "warning_no_recent_pr",
+                        "No open or recently merged PR found.",
                     )
                 )
-        else:
-            warnings.append(
-                _(
-                    "warning_no_recent_pr",
-                    "No open or recently merged PR found.",
-                )
-            )
+    else:
+        # Without GraphQL every source costs its own REST round trips. They are
+        # independent, so run them on a pool and merge the results in the
+        # original order to keep the output deterministic.
+        def default_branch_head() -> Tuple[str, str]:
+            branch = api.get_default_branch()
+            return branch, api.get_latest_commit_sha(branch)
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        known_heads: Dict[str, str] = {}
+        # Several sources often point at the same commit (a --ref naming the
+        # default branch, a PR given twice...): fetch each commit once.
+        context_futures: Dict[str, Future[List[CheckContext]]] = {}
+        pending: List[Tuple[str, Future[List[CheckContext]]]] = []
+        with ThreadPoolExecutor(max_workers=8) as executor:
+
+            def add_target(ref_value: str, label: str) -> None:
+                # Fetch the checks as soon as a source resolves, while the
+                # lookups of the remaining sources are still in flight.
+                ref_value = known_heads.get(ref_value, ref_value)
+                future = context_futures.get(ref_value)
+                if future is None:
+                    future = context_futures[ref_value] = executor.submit(api.list_check_contexts, ref_value)
+                pending.append((label, future))
+
+            default_future = executor.submit(default_branch_head) if include_default else None
+            pr_futures = [
+                (number, executor.submit(api.get_pull_request_head_sha, number)) for number in prs or ()
+            ]
+            latest_future = executor.submit(api.get_latest_open_pull_request) if include_latest_pr else None
+
+            if default_future is not None:
+                try:
+                    branch, sha = default_future.result()
+                    known_heads[branch] = sha
+                    add_target(sha, f"default:{branch}")
+                except GitHubAPIError as exc:
+                    warnings.append(
+                        _(
+                            "warning_default_branch",
+                            "Default branch: {error}",
+                            error=exc,
+                        )
+                    )
+                    if exc.stderr:
+                        warnings.append(exc.stderr.strip())
+
+            for ref in refs or ():
+                if ref:
+                    add_target(ref, ref)
+
+            for number, future in pr_futures:
+                try:
+                    sha, ref_name = future.result()
+                except GitHubAPIError as exc:
+                    warnings.append(
+                        _(
+                            "warning_pr_specific",
+                            "PR #{number}: {error}",
+                            number=number,
+                            error=exc,
+                        )
+                    )
+                    if exc.stderr:
+                        warnings.append(exc.stderr.strip())
+                    continue
+                add_target(sha, pull_request_label(number, ref_name))
+
+            if latest_future is not None:
+                latest = None
+                try:
+                    latest = latest_future.result()
+                except GitHubAPIError as exc:
+                    warnings.append(
+                        _(
+                            "warning_latest_open_pr",
+                            "Latest open PR: {error}",
+                            error=exc,
+                        )
+                    )
+                    if exc.stderr:
+                        warnings.append(exc.stderr.strip())
+                if not latest:
+                    try:
+                        latest = api.get_latest_merged_pull_request()
+                    except GitHubAPIError as exc:
+                        warnings.append(
+                            _(
+                                "warning_latest_merged_pr",
+                                "Latest merged PR: {error}",
+                                error=exc,
+                            )
+                        )
+                        if exc.stderr:
+                            warnings.append(exc.stderr.strip())
+                        latest = None
+                if latest:
+                    sha = latest.get("head", {}).get("sha")
+                    if sha:
+                        label = pull_request_label(latest.get("number"), latest.get("head", {}).get("ref"))
+                        if latest.get("merged_at") and latest.get("state") != "open":
+                            label += " [merged]"
+                        add_target(sha, label)
+                    else:
+                        warnings.append(
+                            _(
+                                "warning_latest_pr_no_sha",
+                                "Latest PR: unable to determine head SHA.",
+                            )
+                        )
+                else:
+                    warnings.append(
+                        _(
+                            "warning_no_recent_pr",
+                            "No open or recently merged PR found.",
+                        )
+                    )
+
+            for label, future in pending:
+                try:
+                    contexts = future.result()
+                except GitHubAPIError as exc:
+                    warnings.append(f"{label}: {exc}")
+                    if exc.stderr:
+                        warnings.append(exc.stderr.strip())
+                    continue
+                add_contexts(contexts, label)
 
     context_entries: List[Dict[str, Any]] = []
-    for data in contexts_map.values():
-        data["kinds"] = sorted(data["kinds"])
-        data["sources"] = sorted(data["sources"])
+    for key in sorted(contexts_map):
+        data = contexts_map[key]
+        kinds, sources = data["kinds"], data["sources"]
+        data["kinds"] = [kind for kind, bit in _CHECK_KIND_BITS.items() if kinds & bit]
+        data["sources"] = sorted(label for label, bit in source_bits.items() if sources & bit)
         context_entries.append(data)
-
-    context_entries.sort(key=lambda item: (item["context"], item.get("integration_id") or -1))
     return context_entries, inspected_sources, warnings
 
 
+def format_warnings(warnings: Sequence[str]) -> List[str]:
+    return [_("warning_prefix", "Warning: {message}", message=warning) for warning in warnings]
+
+
 def handle_checks_list(api: GitHubAPI, args: argparse.Namespace) -> None:
     refs = [args.ref] if args.ref else []
     context_entries, inspected_sources, warnings = collect_check_contexts(
@@ -709,38 +1001,59 @@ def handle_checks_list(api: GitHubAPI, args: argparse.Namespace) -> None:
         include_latest_pr=args.latest_pr,
     )
 
-    for warning in warnings:
-        print(_("warning_prefix", "Warning: {message}", message=warning), file=sys.stderr)
+    if warnings:
+        sys.stderr.write("\n".join(format_warnings(warnings)) + "\n")
 
     if not context_entries:
         print(_("checks_none_found", "No checks detected among the inspected references."))
         return
 
-    print(_("checks_detected_heading", "Detected checks:"))
-    for entry in context_entries:
-        label = entry["context"]
-        integration_id = entry.get("integration_id")
-        app_parts: List[str] = []
-        if entry.get("app_slug"):
-            app_parts.append(entry["app_slug"])
-        elif entry.get("app_name"):
-            app_parts.append(entry["app_name"])
-        if integration_id is not None:
-            info = f"integration {integration_id}"
-            if app_parts:
-                info += f" ({', '.join(app_parts)})"
-            label += f" [{info}]"
-        elif app_parts:
-            label += f" [app {', '.join(app_parts)}]"
-        if entry.get("kinds"):
-            label += f" <{', '.join(entry['kinds'])}>"
-        origins = ", ".join(entry["sources"])
-        print(_("checks_entry", "- {label}  [sources: {origins}]", label=label, origins=origins))
-
+    lines = [_("checks_detected_heading", "Detected checks:")]
+    lines.extend(
+        _(
+            "checks_entry",
+            "- {label}  [sources: {origins}]",
+            label=format_check_label(entry),
+            origins=", ".join(entry["sources"]),
+        )
+        for entry in context_entries
+    )
     if inspected_sources:
-        print(_("checks_inspected_heading", "\nInspected references:"))
-        for label in inspected_sources:
-            print(_("checks_reference_entry", "- {label}", label=label))
+        lines.append(_("checks_inspected_heading", "\nInspected references:"))
+        lines.extend(_("checks_reference_entry", "- {label}", label=label) for label in inspected_sources)
+    print("\n".join(lines))
+
+
+def format_check_label(entry: Dict[str, Any]) -> str:
+    label = entry["context"]
+    integration_id = entry.get("integration_id")
+    app = entry.get("app_slug") or entry.get("app_name")
+    if integration_id is not None:
+        info = f"integration {integration_id}"
+        if app:
+            info += f" ({app})"
+        label += f" [{info}]"
+    elif app:
+        label += f" [app {app}]"
+    if entry.get("kinds"):
+        label += f" <{', '.join(entry['kinds'])}>"
+    return label
+
+
+# Keyed by command name, or by (command, subcommand) for nested commands.
+_HANDLERS: Dict[Any, Callable[[GitHubAPI, argparse.Namespace], None]] = {
+    "list": handle_list,
+    "view": handle_view,
+    "delete": handle_delete,
+    "create": handle_create,
+    "update": handle_update,
+    ("rule", "list"): handle_rule_list,
+    ("rule", "add"): handle_rule_add,
+    ("rule", "edit"): handle_rule_edit,
+    ("rule", "delete"): handle_rule_delete,
+    ("rule", "batch"): handle_rule_batch,
+    "checks": handle_checks_list,
+}
 
 
 # ---------------------------------------------------------------------------
@@ -750,8 +1063,13 @@ def handle_checks_list(api: GitHubAPI, args: argparse.Namespace) -> None:
 def interactive_ruleset_builder(
     api: GitHubAPI,
     existing: Optional[Dict[str, Any]] = None,
+    *,
+    bypass_actors: Optional[List[Dict[str, Any]]] = None,
 ) -> Dict[str, Any]:
-    data = deepcopy(existing) if existing else {}
+    # Works on ``existing`` in place; callers hand over a copy
+    # (prepare_ruleset_payload(..., clone=True)). Bypass actors given up front
+    # (--bypass-spec) replace the bypass prompts.
+    data = existing if existing is not None else {}
 
     data["name"] = prompt_string(
         _("prompt_ruleset_name", "Ruleset name"),
@@ -768,16 +1086,21 @@ def interactive_ruleset_builder(
         default=data.get("enforcement", "active"),
     )
 
-    conditions = data.get("conditions", {})
-    ref_conditions = conditions.get("ref_name", {})
-    include_values = list(ref_conditions.get("include", []))
-    has_default_branch = any(is_default_branch_pattern(value) for value in include_values)
-    include_defaults = [
-        strip_ref_prefix(value)
-        for value in include_values
-        if not is_default_branch_pattern(value)
-    ]
-    exclude_defaults = [strip_ref_prefix(value) for value in ref_conditions.get("exclude", [])]
+    # The API may send null for any of these; "or" also avoids building empty
+    # containers when they are absent.
+    conditions = data.get("conditions") or {}
+    ref_conditions = conditions.get("ref_name") or {}
+    # One pass over the patterns: the default branch token is set aside and
+    # every other pattern loses its refs/heads/ or refs/tags/ prefix.
+    has_default_branch = False
+    include_defaults: List[str] = []
+    for value in ref_conditions.get("include") or ():
+        if value in _DEFAULT_BRANCH_PATTERNS:
+            has_default_branch = True
+        else:
+            include_defaults.append(strip_ref_prefix(value))
+    exclude_defaults = [strip_ref_prefix(value) for value in ref_conditions.get("exclude") or ()]
+    ref_formatter = partial(format_ref_pattern, target=data["target"])
 
     include: List[str] = []
     include_default_branch = prompt_yes_no(
@@ -808,7 +1131,7 @@ def interactive_ruleset_builder(
                 target=data["target"],
             ),
             default=include_defaults,
-            formatter=lambda value: format_ref_pattern(value, data["target"]),
+            formatter=ref_formatter,
         )
         include.extend(extra_include)
 
@@ -819,7 +1142,7 @@ def interactive_ruleset_builder(
             target=data["target"],
         ),
         default=exclude_defaults,
-        formatter=lambda value: format_ref_pattern(value, data["target"]),
+        formatter=ref_formatter,
     )
 
     new_conditions = {}
@@ -828,11 +1151,13 @@ def interactive_ruleset_builder(
     data["conditions"] = new_conditions
 
     bypass = data.get("bypass_actors")
-    if bypass and prompt_yes_no(
+    if bypass_actors is not None:
+        bypass = bypass_actors
+    elif bypass and prompt_yes_no(
         _("prompt_modify_bypass", "Edit existing bypass actors?"),
         default=False,
     ):
-        bypass = edit_bypass_actors(bypass)
+        bypass = edit_bypass_actors(api, bypass)
     elif bypass is None:
         bypass = []
         if prompt_yes_no(
@@ -842,7 +1167,7 @@ def interactive_ruleset_builder(
             ),
             default=False,
         ):
-            bypass = edit_bypass_actors([])
+            bypass = edit_bypass_actors(api, [])
     data["bypass_actors"] = bypass
 
     rules = data.get("rules") or []
@@ -856,41 +1181,62 @@ def manage_rules_interactively(
     current_rules: List[Dict[str, Any]],
     action: str | None = None,
 ) -> List[Dict[str, Any]]:
-    rules = deepcopy(current_rules)
-    while True:
-        if action == "add":
-            rules.append(add_rule_interactively(api))
-            return rules
-
-        print(_("manage_rules_current", "\nCurrent rules:"))
+    # Rules themselves are replaced rather than mutated, so a shallow copy
+    # keeps the caller's list intact.
+    rules = list(current_rules)
+
+    # Rules are replaced rather than mutated while the menu runs, so each one
+    # is summarized once however often the list is redrawn. The cache holds
+    # the rule itself so its id cannot be reused by another object.
+    summaries: Dict[int, Tuple[Dict[str, Any], str]] = {}
+
+    def summary(rule: Dict[str, Any]) -> str:
+        cached = summaries.get(id(rule))
+        if cached is None or cached[0] is not rule:
+            cached = summaries[id(rule)] = (rule, summarize_rule(rule))
+        return cached[1]
+
+    def render_menu() -> Tuple[str, FrozenSet[str]]:
+        lines = [_("manage_rules_current", "\nCurrent rules:")]
         if not rules:
-            print(_("manage_rules_none", "- (none)"))
+            lines.append(_("manage_rules_none", "- (none)"))
         else:
-            for idx, rule in enumerate(rules, start=1):
-                print(
-                    _(
-                        "manage_rules_entry",
-                        "[{index}] {summary}",
-                        index=idx,
-                        summary=summarize_rule(rule),
-                    )
+            lines.extend(
+                _(
+                    "manage_rules_entry",
+                    "[{index}] {summary}",
+                    index=idx,
+                    summary=summary(rule),
                 )
-
-        print(_("manage_options_heading", "\nOptions:"))
-        print(_("manage_option_add", "1. Add a rule"))
+                for idx, rule in enumerate(rules, start=1)
+            )
+        lines.append(_("manage_options_heading", "\nOptions:"))
+        lines.append(_("manage_option_add", "1. Add a rule"))
         if rules:
-            print(_("manage_option_edit", "2. Edit a rule"))
-            print(_("manage_option_delete", "3. Delete a rule"))
-            print(_("manage_option_finish", "4. Finish"))
-            choices = {"1", "2", "3", "4"}
-        else:
-            print(_("manage_option_finish_only", "2. Finish"))
-            choices = {"1", "2"}
+            lines.append(_("manage_option_edit", "2. Edit a rule"))
+            lines.append(_("manage_option_delete", "3. Delete a rule"))
+            lines.append(_("manage_option_finish", "4. Finish"))
+            return "\n".join(lines), _MENU_CHOICES_WITH_RULES
+        lines.append(_("manage_option_finish_only", "2. Finish"))
+        return "\n".join(lines), _MENU_CHOICES_EMPTY
+
+    # The menu only changes when the rules do: an invalid answer just asks
+    # again instead of redrawing it.
+    menu: Optional[Tuple[str, FrozenSet[str]]] = None
+    prompt = _("manage_choice_prompt", "Your choice:") + " "
+    while True:
+        if action == "add":
+            rules.append(add_rule_interactively(api))
+            return rules
 
-        choice = input(_("manage_choice_prompt", "Your choice:" ) + " ").strip()
-        if choice not in choices:
+        if menu is None:
+            menu = render_menu()
+            print(menu[0])
+        choice = input(prompt).strip()
+        if choice not in menu[1]:
             print(_("manage_invalid_choice", "Invalid choice."))
             continue
+        menu = None
 
         if choice == "1":
             rules.append(add_rule_interactively(api))
@@ -912,13 +1258,20 @@ def manage_rules_interactively(
                 _(
                     "rule_deleted",
                     "Rule removed: {summary}",
-                    summary=summarize_rule(removed),
+                    summary=summary(removed),
                 )
             )
         else:
             return rules
 
 
+# Characters of a plain "12 34" list of pull request numbers.
+_PR_LIST_CHARACTERS = frozenset("0123456789 \t")
+
+_MENU_CHOICES_WITH_RULES = frozenset({"1", "2", "3", "4"})
+_MENU_CHOICES_EMPTY = frozenset({"1", "2"})
+
+
 def add_rule_interactively(api: GitHubAPI) -> Dict[str, Any]:
     print(_("add_rule_type_heading", "\nType of rule to add:"))
     print(_("add_rule_option_required_checks", "1. Required status checks"))
@@ -982,10 +1335,14 @@ def build_required_status_rule(
                 "Additional PR numbers (space-separated): ",
             )
         ).strip()
-        if pr_input:
+        if pr_input and set(pr_input) <= _PR_LIST_CHARACTERS:
+            # The usual case: nothing but numbers, checked in one pass.
+            pr_numbers = list(map(int, pr_input.split()))
+        elif pr_input:
             for token in pr_input.split():
-                if token.isdigit():
-                    pr_numbers.append(int(token))
+                number = parse_number(token)
+                if number is not None:
+                    pr_numbers.append(number)
                 else:
                     print(
                         _(
@@ -1009,14 +1366,14 @@ def build_required_status_rule(
             prs=pr_numbers,
             include_latest_pr=include_latest_pr,
         )
-        for warning in warnings:
-            print(_("warning_prefix", "Warning: {message}", message=warning))
+        lines = format_warnings(warnings)
         if inspected_sources:
-            print(_("checks_inspected_heading", "\nInspected references:"))
-            for label in inspected_sources:
-                print(_("checks_reference_entry", "- {label}", label=label))
+            lines.append(_("checks_inspected_heading", "\nInspected references:"))
+            lines.extend(_("checks_reference_entry", "- {label}", label=label) for label in inspected_sources)
         if not available_entries:
-            print(_("required_checks_none", "No checks detected for the selected references."))
+            lines.append(_("required_checks_none", "No checks detected for the selected references."))
+        if lines:
+            print("\n".join(lines))
 
     contexts = prompt_status_checks(contexts, available_entries)
     cleaned_checks: List[Dict[str, Any]] = []
@@ -1056,74 +1413,71 @@ def prompt_status_checks(
     checks = [dict(item) for item in existing_checks]
     available_entries = list(available_entries or [])
 
+    # Index the observed apps once instead of scanning every entry per check.
+    observed_apps: Dict[Tuple[Any, int], str] = {}
+    for entry in available_entries:
+        integration_app = entry.get("app_slug") or entry.get("app_name")
+        if entry.get("integration_id") is not None and integration_app:
+            observed_apps.setdefault((entry.get("context"), entry["integration_id"]), integration_app)
+
     for check in checks:
         if check.get("integration_id") is not None:
-            for entry in available_entries:
-                if (
-                    entry.get("integration_id") == check.get("integration_id")
-                    and entry.get("context") == check.get("context")
-                ):
-                    integration_app = entry.get("app_slug") or entry.get("app_name")
-                    if integration_app:
-                        check.setdefault("integration_app", integration_app)
-                    break
-
-    def format_entry(entry: Dict[str, Any]) -> str:
-        label = entry["context"]
-        integration_id = entry.get("integration_id")
-        app_parts: List[str] = []
-        if entry.get("app_slug"):
-            app_parts.append(entry["app_slug"])
-        elif entry.get("app_name"):
-            app_parts.append(entry["app_name"])
-        if integration_id is not None:
-            info = f"integration {integration_id}"
-            if app_parts:
-                info += f" ({', '.join(app_parts)})"
-            label += f" [{info}]"
-        elif app_parts:
-            label += f" [app {', '.join(app_parts)}]"
-        if entry.get("kinds"):
-            label += f" <{', '.join(entry['kinds'])}>"
-        sources = ", ".join(entry.get("sources", []))
-        if sources:
-            label += f"  [sources: {sources}]"
-        return label
+            integration_app = observed_apps.get((check.get("context"), check["integration_id"]))
+            if integration_app:
+                check.setdefault("integration_app", integration_app)
+
+    # The observed checks do not change while prompting: render them once.
+    available_lines: List[str] = []
+    if available_entries:
+        available_lines.append(_("status_checks_recent_heading", "\nRecently observed checks:"))
+        for idx, entry in enumerate(available_entries, start=1):
+            label = format_check_label(entry)
+            sources = ", ".join(entry.get("sources", []))
+            if sources:
+                label += f"  [sources: {sources}]"
+            available_lines.append(f"{idx}. {label}")
+
+    # The menu text is fixed for the whole loop, so it is translated once
+    # here; this cannot happen at import time, before --lang is applied.
+    current_heading = _("status_checks_current_heading", "\nCurrently required checks:")
+    no_checks = _("status_checks_none", "- (none)")
+    options_heading = _("status_checks_options_heading", "\nOptions:")
+    option_add = _("status_checks_option_add", "1. Add a check")
+    options_with_checks = [
+        options_heading,
+        option_add,
+        _("status_checks_option_remove", "2. Remove a check"),
+        _("status_checks_option_finish", "3. Finish"),
+    ]
+    options_without_checks = [
+        options_heading,
+        option_add,
+        _("status_checks_option_finish_only", "2. Finish"),
+    ]
+    choice_prompt = _("status_checks_choice_prompt", "Your choice:") + " "
+    invalid_choice = _("manage_invalid_choice", "Invalid choice.")
+
+    # Labels follow ``checks`` slot for slot, so a redraw only renumbers them.
+    check_labels = [format_required_check(item) for item in checks]
 
-    available_labels = [format_entry(entry) for entry in available_entries]
     while True:
-        print(_("status_checks_current_heading", "\nCurrently required checks:"))
+        lines = [current_heading]
         if not checks:
-            print(_("status_checks_none", "- (none)"))
+            lines.append(no_checks)
         else:
-            for idx, item in enumerate(checks, start=1):
-                integration = item.get("integration_id")
-                extras = []
-                label = f"{item['context']} (integration {integration})" if integration else item["context"]
-                if item.get("integration_id") and item.get("integration_app"):
-                    extras.append(item["integration_app"])
-                if extras:
-                    label += f" [{', '.join(extras)}]"
-                print(f"[{idx}] {label}")
-
-        if available_entries:
-            print(_("status_checks_recent_heading", "\nRecently observed checks:"))
-            for idx, label in enumerate(available_labels, start=1):
-                print(f"{idx}. {label}")
-
-        print(_("status_checks_options_heading", "\nOptions:"))
-        print(_("status_checks_option_add", "1. Add a check"))
+            lines.extend(f"[{idx}] {label}" for idx, label in enumerate(check_labels, start=1))
+        lines.extend(available_lines)
         if checks:
-            print(_("status_checks_option_remove", "2. Remove a check"))
-            print(_("status_checks_option_finish", "3. Finish"))
+            lines.extend(options_with_checks)
             valid = {"1", "2", "3"}
         else:
-            print(_("status_checks_option_finish_only", "2. Finish"))
+            lines.extend(options_without_checks)
             valid = {"1", "2"}
+        print("\n".join(lines))
 
-        choice = input(_("status_checks_choice_prompt", "Your choice:" ) + " ").strip()
+        choice = input(choice_prompt).strip()
         if choice not in valid:
-            print(_("manage_invalid_choice", "Invalid choice."))
+            print(invalid_choice)
             continue
         if choice == "1":
             context_input = input(
@@ -1134,8 +1488,8 @@ def prompt_status_checks(
             ).strip()
             integration_default: Optional[int] = None
             integration_app: Optional[str] = None
-            if context_input.isdigit() and available_entries:
-                idx = int(context_input)
+            idx = parse_number(context_input) if available_entries else None
+            if idx is not None:
                 if 1 <= idx <= len(available_entries):
                     entry = available_entries[idx - 1]
                     context = entry["context"]
@@ -1167,25 +1521,26 @@ def prompt_status_checks(
                 )
             ).strip()
             if integration_raw:
-                if not integration_raw.isdigit():
+                integration_id = parse_number(integration_raw)
+                if integration_id is None:
                     print(_("status_checks_integration_numeric", "Integration ID must be numeric."))
                     continue
-                integration_id = int(integration_raw)
             else:
                 integration_id = integration_default
-            checks.append(
-                {
-                    "context": context,
-                    **({"integration_id": integration_id} if integration_id is not None else {}),
-                    **({"integration_app": integration_app} if integration_app else {}),
-                }
-            )
+            check = {
+                "context": context,
+                **({"integration_id": integration_id} if integration_id is not None else {}),
+                **({"integration_app": integration_app} if integration_app else {}),
+            }
+            checks.append(check)
+            check_labels.append(format_required_check(check))
         elif choice == "2" and checks:
             idx = select_rule_index(
                 checks,
                 _("status_checks_select_remove", "remove"),
             )
             removed = checks.pop(idx)
+            del check_labels[idx]
             print(
                 _(
                     "status_checks_removed",
@@ -1197,37 +1552,55 @@ def prompt_status_checks(
             return checks
 
 
-def edit_bypass_actors(existing: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def edit_bypass_actors(api: GitHubAPI, existing: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     actors = [dict(item) for item in existing]
+    # Fixed menu text, translated once for the loop (see prompt_status_checks).
+    heading = _("bypass_heading", "\nActors allowed to bypass the ruleset:")
+    no_actors = _("manage_rules_none", "- (none)")
+    options_heading = _("manage_options_heading", "\nOptions:")
+    option_add = _("bypass_option_add", "1. Add")
+    options_with_actors = [
+        options_heading,
+        option_add,
+        _("bypass_option_remove", "2. Remove"),
+        _("bypass_option_finish", "3. Finish"),
+    ]
+    options_without_actors = [options_heading, option_add, _("bypass_option_finish_only", "2. Finish")]
+    choice_prompt = _("manage_choice_prompt", "Your choice:") + " "
+    invalid_choice = _("manage_invalid_choice", "Invalid choice.")
+    # Summaries follow ``actors`` slot for slot, like the check labels above.
+    actor_labels = [actor_summary(actor) for actor in actors]
     while True:
-        print(_("bypass_heading", "\nActors allowed to bypass the ruleset:"))
+        lines = [heading]
         if not actors:
-            print(_("manage_rules_none", "- (none)"))
+            lines.append(no_actors)
         else:
-            for idx, actor in enumerate(actors, start=1):
-                label = actor_summary(actor)
-                print(_("manage_rules_entry", "[{index}] {summary}", index=idx, summary=label))
-        print(_("manage_options_heading", "\nOptions:"))
-        print(_("bypass_option_add", "1. Add"))
+            lines.extend(
+                _("manage_rules_entry", "[{index}] {summary}", index=idx, summary=label)
+                for idx, label in enumerate(actor_labels, start=1)
+            )
         if actors:
-            print(_("bypass_option_remove", "2. Remove"))
-            print(_("bypass_option_finish", "3. Finish"))
+            lines.extend(options_with_actors)
             valid = {"1", "2", "3"}
         else:
-            print(_("bypass_option_finish_only", "2. Finish"))
+            lines.extend(options_without_actors)
             valid = {"1", "2"}
-        choice = input(_("manage_choice_prompt", "Your choice:") + " ").strip()
+        print("\n".join(lines))
+        choice = input(choice_prompt).strip()
         if choice not in valid:
-            print(_("manage_invalid_choice", "Invalid choice."))
+            print(invalid_choice)
             continue
         if choice == "1":
-            actors.append(prompt_bypass_actor())
+            actor = prompt_bypass_actor(api)
+            actors.append(actor)
+            actor_labels.append(actor_summary(actor))
         elif choice == "2" and actors:
             idx = select_rule_index(
                 actors,
                 _("manage_select_action_delete", "delete"),
             )
             removed = actors.pop(idx)
+            del actor_labels[idx]
             print(
                 _(
                     "bypass_removed",
@@ -1235,11 +1608,102 @@ def edit_bypass_actors(existing: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
                     summary=actor_summary(removed),
                 )
             )
-        else:
+        elif resolve_pending_teams(api, actors):
             return actors
+        else:
+            # Unknown teams were dropped from the list: relabel what is left.
+            actor_labels = [actor_summary(actor) for actor in actors]
+
+
+def load_bypass_spec(api: GitHubAPI, path: str) -> List[Dict[str, Any]]:
+    """Read a JSON array of bypass actors and resolve its teams in one lookup.
+
+    Entries use the API fields; a Team may be given as ``"team": "ORG/slug"``
+    instead of ``actor_id`` (an ``actor_id`` wins and skips the lookup), and
+    ``bypass_mode`` defaults to ``always``.
+    """
+    spec = load_json_file(path)
+    if not isinstance(spec, list):
+        raise RuntimeError(_("bypass_spec_not_list", "The bypass spec must be a JSON array of actors."))
+
+    actors: List[Dict[str, Any]] = []
+    for index, entry in enumerate(spec, start=1):
+        actor_type = entry.get("actor_type") if isinstance(entry, dict) else None
+        parse = _BYPASS_SPEC_PARSERS.get(actor_type)
+        fields = parse(entry) if parse is not None else None
+        if fields is None:
+            raise RuntimeError(
+                _(
+                    "bypass_spec_invalid_entry",
+                    "Bypass spec entry {index}: unknown actor type or missing fields.",
+                    index=index,
+                )
+            )
+        actors.append({"actor_type": actor_type, **fields, "bypass_mode": entry.get("bypass_mode", "always")})
+
+    if not resolve_pending_teams(api, actors):
+        raise RuntimeError(_("bypass_spec_unknown_teams", "The bypass spec references unknown teams."))
+    return actors
+
+
+def _spec_repository_role(entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    role = entry.get("repository_role_name")
+    return {"repository_role_name": role} if isinstance(role, str) and role else None
+
+
+def _spec_team(entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if isinstance(entry.get("actor_id"), int):
+        return {"actor_id": entry["actor_id"]}
+    team = entry.get("team")
+    if not isinstance(team, str) or "/" not in team:
+        return None
+    org, slug = team.split("/", 1)
+    return {"actor_id": None, "_team": (org, slug)}
+
+
+def _spec_integration(entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    actor_id = entry.get("actor_id")
+    return {"actor_id": actor_id} if isinstance(actor_id, int) else None
+
+
+def _spec_admin(entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    return {}
+
+
+# Fields of each bypass actor type, or None when a spec entry lacks them.
+_BYPASS_SPEC_PARSERS: Dict[Any, Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]] = {
+    "RepositoryRole": _spec_repository_role,
+    "Team": _spec_team,
+    "Integration": _spec_integration,
+    "OrganizationAdmin": _spec_admin,
+    "EnterpriseAdmin": _spec_admin,
+}
+
+
+def resolve_pending_teams(api: GitHubAPI, actors: List[Dict[str, Any]]) -> bool:
+    """Fill in the IDs of newly added Team actors with a single lookup.
+
+    Unknown teams are reported and dropped; returns False when that happened
+    so the user can review the list again.
+    """
+    pending = [actor for actor in actors if "_team" in actor]
+    if not pending:
+        return True
+    team_ids = api.get_team_ids(actor["_team"] for actor in pending)
+    complete = True
+    for actor in pending:
+        team = actor.pop("_team")
+        team_id = team_ids.get(team)
+        if team_id is None:
+            print(_("bypass_team_not_found", "Team not found, actor removed: {team}", team="/".join(team)))
+            actors.remove(actor)
+            complete = False
+        else:
+            actor["actor_id"] = team_id
+    return complete
 
 
-def prompt_bypass_actor() -> Dict[str, Any]:
+def prompt_bypass_actor(api: GitHubAPI) -> Dict[str, Any]:
     print(_("bypass_actor_type_heading", "\nActor type:"))
     print(_("bypass_actor_option_repo", "1. RepositoryRole (e.g. admin, maintain)"))
     print(_("bypass_actor_option_team", "2. Team (ORG/slug)"))
@@ -1266,169 +1730,141 @@ def prompt_bypass_actor() -> Dict[str, Any]:
         if "/" not in team:
             raise RuntimeError(_("bypass_team_format", "Expected format: ORG/slug."))
         org, slug = team.split("/", 1)
-        actor_id = resolve_team_id(org, slug)
-        return {"actor_type": "Team", "actor_id": actor_id, "bypass_mode": bypass_mode}
+        # Resolved with the other new teams once the list is complete.
+        return {"actor_type": "Team", "actor_id": None, "bypass_mode": bypass_mode, "_team": (org, slug)}
     if choice == "3":
-        integration = input(_("bypass_integration_prompt", "Integration ID: ")).strip()
-        if not integration.isdigit():
+        integration_id = parse_number(input(_("bypass_integration_prompt", "Integration ID: ")))
+        if integration_id is None:
             raise RuntimeError(_("status_checks_integration_numeric", "Integration ID must be numeric."))
         return {
             "actor_type": "Integration",
-            "actor_id": int(integration),
+            "actor_id": integration_id,
             "bypass_mode": bypass_mode,
         }
     actor_type = "OrganizationAdmin" if choice == "4" else "EnterpriseAdmin"
     return {"actor_type": actor_type, "bypass_mode": bypass_mode}
 
 
-def resolve_team_id(org: str, slug: str) -> int:
-    command = [
-        "gh",
-        "api",
-        f"/orgs/{org}/teams/{slug}",
-        "--method",
-        "GET",
-        "-H",
-        "Accept: application/vnd.github+json",
-        "-H",
-        "X-GitHub-Api-Version: 2022-11-28",
-    ]
-    completed = subprocess_run(command)
-    data = json.loads(completed)
-    team_id = data.get("id")
-    if not isinstance(team_id, int):
-        raise RuntimeError(_("bypass_team_lookup_failed", "Unable to retrieve team identifier."))
-    return team_id
-
-
-def subprocess_run(command: List[str]) -> str:
-    import subprocess
-
-    try:
-        result = subprocess.run(
-            command,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            check=True,
-        )
-    except subprocess.CalledProcessError as exc:  # pragma: no cover - interactive flow
-        stderr = exc.stderr.decode("utf-8", errors="replace")
-        raise RuntimeError(
-            _(
-                "subprocess_error",
-                "Command {command} failed: {stderr}",
-                command=" ".join(command),
-                stderr=stderr,
-            )
-        ) from exc
-    return result.stdout.decode("utf-8")
+# Translation key, default text and ruleset field of each header line.
+_RULESET_DETAIL_FIELDS = (
+    ("ruleset_details_id", "ID: {value}", "id"),
+    ("ruleset_details_name", "Name: {value}", "name"),
+    ("ruleset_details_target", "Target: {value}", "target"),
+    ("ruleset_details_enforcement", "Enforcement: {value}", "enforcement"),
+    ("ruleset_details_created", "Created: {value}", "created_at"),
+    ("ruleset_details_updated", "Updated: {value}", "updated_at"),
+)
 
 
 def print_ruleset_details(ruleset: Dict[str, Any]) -> None:
-    print(_("ruleset_details_id", "ID: {value}", value=ruleset.get("id")))
-    print(_("ruleset_details_name", "Name: {value}", value=ruleset.get("name")))
-    print(_("ruleset_details_target", "Target: {value}", value=ruleset.get("target")))
-    print(
-        _(
-            "ruleset_details_enforcement",
-            "Enforcement: {value}",
-            value=ruleset.get("enforcement"),
-        )
-    )
-    print(
-        _(
-            "ruleset_details_created",
-            "Created: {value}",
-            value=ruleset.get("created_at"),
-        )
-    )
-    print(
-        _(
-            "ruleset_details_updated",
-            "Updated: {value}",
-            value=ruleset.get("updated_at"),
-        )
-    )
+    lines = [_(key, default, value=ruleset.get(field)) for key, default, field in _RULESET_DETAIL_FIELDS]
 
     conditions = ruleset.get("conditions") or {}
     if conditions:
-        print(_("ruleset_details_conditions", "Conditions:"))
-        for key, value in conditions.items():
-            print(_("ruleset_details_condition_entry", "  - {key}: {value}", key=key, value=value))
+        lines.append(_("ruleset_details_conditions", "Conditions:"))
+        lines.extend(
+            _("ruleset_details_condition_entry", "  - {name}: {value}", name=name, value=value)
+            for name, value in conditions.items()
+        )
     bypass = ruleset.get("bypass_actors") or []
     if bypass:
-        print(_("ruleset_details_bypass", "Bypass actors:"))
-        for actor in bypass:
-            print(_("ruleset_details_bypass_entry", "  - {summary}", summary=actor_summary(actor)))
+        lines.append(_("ruleset_details_bypass", "Bypass actors:"))
+        lines.extend(
+            _("ruleset_details_bypass_entry", "  - {summary}", summary=actor_summary(actor)) for actor in bypass
+        )
 
     rules = ruleset.get("rules") or []
     if rules:
-        print(_("ruleset_details_rules", "Rules:"))
-        for idx, rule in enumerate(rules, start=1):
-            print(
-                _(
-                    "ruleset_details_rule_entry",
-                    "  [{index}] {summary}",
-                    index=idx,
-                    summary=summarize_rule(rule),
-                )
-            )
+        lines.append(_("ruleset_details_rules", "Rules:"))
+        lines.extend(
+            _("ruleset_details_rule_entry", "  [{index}] {summary}", index=idx, summary=summarize_rule(rule))
+            for idx, rule in enumerate(rules, start=1)
+        )
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def summarize_rule(rule: Dict[str, Any]) -> str:
-    rule_type = rule.get("type", "?")
-    if rule_type == "required_status_checks":
-        contexts = []
-        for item in rule.get("parameters", {}).get("required_status_checks", []):
-            label = item.get("context", "?")
-            integration_id = item.get("integration_id")
-            if integration_id is not None:
-                label += f" (integration {integration_id})"
-            contexts.append(label)
-        return f"required_status_checks ({', '.join(contexts)})"
-    return json.dumps(
-        {k: v for k, v in rule.items() if k not in {"conditions"}},
-        ensure_ascii=False,
-    )
+    summarize = _RULE_SUMMARIES.get(rule.get("type"), _summarize_rule_json)
+    return summarize(rule)
+
+
+def _summarize_status_checks_rule(rule: Dict[str, Any]) -> str:
+    contexts = []
+    for item in (rule.get("parameters") or {}).get("required_status_checks") or ():
+        label = item.get("context", "?")
+        integration_id = item.get("integration_id")
+        if integration_id is not None:
+            label += f" (integration {integration_id})"
+        contexts.append(label)
+    return f"required_status_checks ({', '.join(contexts)})"
+
+
+def _summarize_rule_json(rule: Dict[str, Any]) -> str:
+    # Rules rarely carry conditions: copy only when there is one to drop.
+    if "conditions" in rule:
+        rule = rule.copy()
+        del rule["conditions"]
+    return json.dumps(rule, ensure_ascii=False)
+
 
+# Rule types with a dedicated one-line summary; others are shown as JSON.
+_RULE_SUMMARIES: Dict[Any, Callable[[Dict[str, Any]], str]] = {
+    "required_status_checks": _summarize_status_checks_rule,
+}
 
-def summary_for_rule(rule: Dict[str, Any]) -> str:
-    return summarize_rule(rule)
+
+# What identifies an actor of each type; other types are shown by name only.
+_ACTOR_LABELS: Dict[Any, Callable[[Dict[str, Any]], Any]] = {
+    "RepositoryRole": lambda actor: actor.get("repository_role_name"),
+    # Teams added in this session show their ORG/slug until resolved.
+    "Team": lambda actor: "/".join(actor["_team"]) if "_team" in actor else actor.get("actor_id"),
+    "Integration": lambda actor: actor.get("actor_id"),
+}
+
+
+def format_required_check(check: Dict[str, Any]) -> str:
+    integration = check.get("integration_id")
+    if not integration:
+        return check["context"]
+    label = f"{check['context']} (integration {integration})"
+    if check.get("integration_app"):
+        label += f" [{check['integration_app']}]"
+    return label
 
 
 def actor_summary(actor: Dict[str, Any]) -> str:
     actor_type = actor.get("actor_type")
-    if actor_type == "RepositoryRole":
-        return f"RepositoryRole:{actor.get('repository_role_name')} ({actor.get('bypass_mode')})"
-    if actor_type == "Team":
-        return f"Team:{actor.get('actor_id')} ({actor.get('bypass_mode')})"
-    if actor_type == "Integration":
-        return f"Integration:{actor.get('actor_id')} ({actor.get('bypass_mode')})"
-    return f"{actor_type} ({actor.get('bypass_mode')})"
+    label = _ACTOR_LABELS.get(actor_type)
+    if label is None:
+        return f"{actor_type} ({actor.get('bypass_mode')})"
+    return f"{actor_type}:{label(actor)} ({actor.get('bypass_mode')})"
 
 
 def select_rule_index(items: List[Any], action: str) -> int:
-    response = input(
-        _(
-            "select_rule_prompt",
-            "Index of the rule to {action}: ",
-            action=action,
+    number = parse_number(
+        input(
+            _(
+                "select_rule_prompt",
+                "Index of the rule to {action}: ",
+                action=action,
+            )
         )
-    ).strip()
-    if not response.isdigit():
+    )
+    if number is None:
         raise RuntimeError(_("select_rule_numeric", "Numeric index expected."))
-    idx = int(response) - 1
-    if not (0 <= idx < len(items)):
+    idx = number - 1
+    if not 0 <= idx < len(items):
         raise RuntimeError(_("select_rule_out_of_range", "Index out of range."))
     return idx
 
 
 def load_json_file(path: str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as handle:
-        return json.load(handle)
+    # json.loads decodes bytes itself, so the file skips the text layer.
+    with open(path, "rb") as handle:
+        return json.loads(handle.read())
 
 
-def prepare_ruleset_payload(data: Dict[str, Any]) -> Dict[str, Any]:
+def prepare_ruleset_payload(data: Dict[str, Any], *, clone: bool = False) -> Dict[str, Any]:
     payload = {
         "name": data.get("name"),
         "target": data.get("target", "branch"),
@@ -1439,6 +1875,10 @@ def prepare_ruleset_payload(data: Dict[str, Any]) -> Dict[str, Any]:
         payload["conditions"] = data.get("conditions") or {}
     if "bypass_actors" in data:
         payload["bypass_actors"] = data.get("bypass_actors") or []
+    if clone:
+        # Copy only what the payload keeps: server-assigned fields (_links,
+        # node_id, timestamps...) are dropped above and never traversed.
+        payload = clone_json(payload)
     return payload
 
 
@@ -1451,44 +1891,68 @@ def validate_rule_payload(payload: Dict[str, Any]) -> None:
             )
         )
 
+    # Same schema as the ruleset-level validation, so problems surface while
+    # the rule is being edited rather than when the ruleset is submitted.
+    from .validation import validate_rule
+
+    errors = validate_rule(payload)
+    if not errors:
+        return
+    print(_("validation_errors_heading", "OpenAPI validation errors detected:"))
+    print("\n".join(f"- {error}" for error in errors))
+    if not prompt_yes_no(_("rule_validation_keep", "Keep this rule anyway?"), default=False):
+        raise RuntimeError(_("rule_validation_discarded", "Rule discarded."))
+
+
+_REF_PREFIX_RE = re.compile(r"refs/(?:heads|tags)/")
+
 
 def strip_ref_prefix(value: str) -> str:
-    for prefix in ("refs/heads/", "refs/tags/"):
-        if value.startswith(prefix):
-            return value[len(prefix) :]
-    return value
+    match = _REF_PREFIX_RE.match(value)
+    return value[match.end() :] if match else value
 
 
-def is_default_branch_pattern(value: str) -> bool:
-    return value in {DEFAULT_BRANCH_TOKEN, DEFAULT_BRANCH_REF}
+_DEFAULT_BRANCH_PATTERNS = frozenset({DEFAULT_BRANCH_TOKEN, DEFAULT_BRANCH_REF})
 
 
 def format_ref_pattern(value: str, target: str) -> str:
     value = value.strip()
     if not value:
         return value
-    if value.startswith("~"):
-        return value
-    if value.startswith("refs/"):
+    if value.startswith(("~", "refs/")):
         return value
     if target == "tag":
         return f"refs/tags/{value}"
     return f"refs/heads/{value}"
 
 
-def print_table(headers: List[str], rows: List[List[str]]) -> None:
-    widths = [len(header) for header in headers]
-    for row in rows:
-        for idx, cell in enumerate(row):
-            widths[idx] = max(widths[idx], len(str(cell)))
+def print_table(headers: Sequence[str], rows: Iterable[Sequence[Any]]) -> None:
+    cells = [list(map(str, row)) for row in rows]
+    widths = [max(map(len, column)) for column in zip(headers, *cells)]
+    separator = ["-" * width for width in widths]
+    template = "  ".join(f"{{:<{width}}}" for width in widths)
+    lines = [template.format(*row) for row in (headers, separator, *cells)]
+    sys.stdout.write("\n".join(lines) + "\n")
+
 
-    def format_row(row: List[str]) -> str:
-        return "  ".join(str(cell).ljust(widths[idx]) for idx, cell in enumerate(row))
+def clone_json(data: Any) -> Any:
+    # Payloads only hold dicts, lists and immutable scalars: copying the
+    # containers and sharing the leaves is all a deep copy needs, without
+    # copy.deepcopy's memo or a serialisation round trip.
+    kind = type(data)
+    if kind is dict:
+        return {key: clone_json(value) for key, value in data.items()}
+    if kind is list:
+        return [clone_json(item) for item in data]
+    return data
 
-    print(format_row(headers))
-    print(format_row(["-" * width for width in widths]))
-    for row in rows:
-        print(format_row(row))
+
+def print_json(data: Any, *, compact: bool = False) -> None:
+    if compact:
+        text = json.dumps(data, separators=(",", ":"))
+    else:
+        text = json.dumps(data, indent=2)
+    sys.stdout.write(text + "\n")
 
 
 if __name__ == "__main__":  # pragma: no cover
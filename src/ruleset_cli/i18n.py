@@ -83,6 +83,7 @@ _TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "prompt_skip_validation": "Ne pas valider localement le payload via le schéma OpenAPI.",
         "prompt_select_language": "Langue",
         "arg_lang_help": "Langue de l'interface (défaut : anglais).",
+        "arg_no_cache_help": "Ignorer les caches sur disque sans les mettre à jour.",
         "arg_repo_help": "Dépôt cible (OWNER/REPO ou HOST/OWNER/REPO). Par défaut utilise le dépôt courant.",
         "command_list_help": "Lister les rulesets du dépôt.",
         "command_view_help": "Afficher un ruleset précis.",
@@ -94,12 +95,18 @@ _TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "option_file_help": "Fichier JSON pré-rempli pour la création. Si omis, un assistant interactif est utilisé.",
         "option_from_existing_help": "Cloner un ruleset existant avant modifications interactives.",
         "option_editor_help": "Ouvrir l'objet JSON final dans l'éditeur par défaut avant envoi.",
+        "option_bypass_spec_help": "Fichier JSON listant les acteurs de contournement ; remplace les questions interactives correspondantes.",
+        "option_no_prompt_help": "Ne jamais poser de question (scripts) : nécessite --file et abandonne en cas d'erreur de validation.",
+        "option_rule_batch_no_prompt_help": "Ne jamais poser de question (scripts) : abandonne en cas d'erreur de validation au lieu de demander s'il faut continuer.",
+        "error_no_prompt_arguments": "--no-prompt nécessite --file et ne peut pas être combiné avec --editor.",
         "option_skip_validate_help": "Ne pas valider localement le payload via le schéma OpenAPI.",
         "option_rule_skip_validate_help": "Ne pas valider localement les modifications de ruleset.",
         "command_rules_list_help": "Lister les règles d'un ruleset.",
         "command_rules_add_help": "Ajouter une règle à un ruleset.",
         "command_rules_edit_help": "Modifier une règle existante.",
         "command_rules_delete_help": "Supprimer une règle d'un ruleset.",
+        "command_rules_batch_help": "Appliquer plusieurs modifications de règles depuis un fichier en une seule mise à jour.",
+        "arg_rule_batch_file": "Tableau JSON d'opérations : {{\"op\": \"add\", \"rule\": {{...}}}}, {{\"op\": \"edit\", \"index\": N, \"rule\": {{...}}}} ou {{\"op\": \"delete\", \"index\": N}}.",
         "option_rules_delete_confirm_help": "Confirmation automatique (non interactif).",
         "command_checks_help": "Lister les checks (statuts/actions) récemment observés.",
         "option_checks_ref_help": "Référence (branche ou SHA) pour détecter les checks. Défaut : branche par défaut.",
@@ -132,8 +139,14 @@ _TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "rule_delete_confirm": "Supprimer la règle [{index}] {summary} ?",
         "action_rule_delete": "la suppression de la règle",
         "rule_deleted": "Règle supprimée : {summary}",
+        "rule_batch_not_list": "Le fichier d'opérations sur les règles doit contenir un tableau JSON.",
+        "action_rule_batch": "l'application des modifications de règles",
+        "rule_batch_applied": "{count} modifications de règles appliquées. Le ruleset compte désormais {total} règles.",
+        "rule_batch_invalid_operation": "Opération {number} : \"add\" avec une règle, ou \"edit\"/\"delete\" avec un index valide, attendu.",
         "warning_default_branch": "Branche par défaut : {error}",
         "warning_pr_specific": "PR #{number} : {error}",
+        "warning_pr_not_found": "PR #{number} : pull request introuvable.",
+        "warning_default_branch_missing": "Branche par défaut : impossible de déterminer la branche par défaut du dépôt.",
         "warning_latest_open_pr": "PR la plus récente (ouverte) : {error}",
         "warning_latest_merged_pr": "PR la plus récente (fusionnée) : {error}",
         "warning_latest_pr_no_sha": "PR la plus récente : impossible de déterminer le SHA du head.",
@@ -206,9 +219,14 @@ _TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "bypass_role_prompt": "Nom du rôle du dépôt (ex: maintain): ",
         "bypass_role_empty": "Le rôle ne peut pas être vide.",
         "bypass_team_prompt": "Team (ORG/slug): ",
+        "bypass_spec_not_list": "Le fichier de contournement doit contenir un tableau JSON d'acteurs.",
+        "bypass_spec_invalid_entry": "Entrée {index} du fichier de contournement : type d'acteur inconnu ou champs manquants.",
+        "bypass_spec_unknown_teams": "Le fichier de contournement référence des teams introuvables.",
+        "rule_validation_keep": "Conserver cette règle malgré tout ?",
+        "rule_validation_discarded": "Règle abandonnée.",
+        "bypass_team_not_found": "Team introuvable, acteur retiré : {team}",
         "bypass_team_format": "Format attendu : ORG/slug.",
         "bypass_integration_prompt": "Integration ID: ",
-        "bypass_team_lookup_failed": "Impossible de récupérer l'identifiant de l'équipe.",
         "ruleset_details_id": "ID : {value}",
         "ruleset_details_name": "Nom : {value}",
         "ruleset_details_target": "Cible : {value}",
@@ -216,12 +234,11 @@ _TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "ruleset_details_created": "Créé : {value}",
         "ruleset_details_updated": "Mis à jour : {value}",
         "ruleset_details_conditions": "Conditions :",
-        "ruleset_details_condition_entry": "  - {key}: {value}",
+        "ruleset_details_condition_entry": "  - {name} : {value}",
         "ruleset_details_bypass": "Acteurs pouvant contourner :",
         "ruleset_details_bypass_entry": "  - {summary}",
         "ruleset_details_rules": "Règles :",
         "ruleset_details_rule_entry": "  [{index}] {summary}",
-        "subprocess_error": "Commande {command} en erreur : {stderr}",
         "select_rule_prompt": "Index de la règle à {action}: ",
         "select_rule_numeric": "Index numérique attendu.",
         "select_rule_out_of_range": "Index hors limites.",
@@ -229,13 +246,17 @@ _TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "cli_description": "Gérer les rulesets d'un dépôt GitHub.",
         "arg_ruleset_id": "Identifiant numérique du ruleset.",
         "option_json_output": "Sortie JSON brute.",
+        "option_json_compact": "Avec --json, afficher le JSON sur une ligne, sans indentation.",
         "arg_rule_index": "Index (basé sur 1) de la règle.",
     }
 }
 
 
+_LANGUAGE_NAMES: Dict[str, str] = {"en": "English", "fr": "Français"}
+
+
 def available_languages() -> Dict[str, str]:
-    return {"en": "English", "fr": "Français"}
+    return dict(_LANGUAGE_NAMES)
 
 
 def set_language(lang: str | None) -> None:
@@ -244,7 +265,7 @@ def set_language(lang: str | None) -> None:
         _language = DEFAULT_LANGUAGE
         return
     normalized = lang.lower()
-    if normalized in ("en", "fr"):
+    if normalized in _LANGUAGE_NAMES:
         _language = normalized
     else:
         _language = DEFAULT_LANGUAGE
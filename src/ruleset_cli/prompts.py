@@ -2,15 +2,33 @@ from __future__ import annotations
 
 import json
 import os
+import re
+import shlex
 import shutil
 import subprocess
 import sys
 import tempfile
 from pathlib import Path
-from typing import Any, Iterable, List, Optional, Sequence
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Union
 
+from .api import gh_executable
 from .i18n import translate as _
 
+# Annotation lines in the editor buffer: ``#`` or ``//`` after optional indentation.
+_COMMENT_LINE_RE = re.compile(rb"\s*(?:#|//)")
+
+
+def parse_number(text: str) -> Optional[int]:
+    """Return the number typed in ``text`` with ASCII digits only, or None.
+
+    int() alone would also accept signs, underscores and non-ASCII digits.
+    """
+
+    text = text.strip()
+    if not (text.isascii() and text.isdigit()):
+        return None
+    return int(text)
+
 
 def prompt_string(
     message: str,
@@ -46,8 +64,9 @@ def prompt_choice(
     indexed = list(enumerate(choices, start=1))
     options = ", ".join(f"{idx}={label}" for idx, label in indexed)
     default_idx: Optional[int] = None
-    if default and default in choices:
-        default_idx = choices.index(default) + 1
+    if default:
+        # One scan finds both membership and position.
+        default_idx = next((idx for idx, label in indexed if label == default), None)
 
     while True:
         prompt = f"{message} ({options})"
@@ -57,10 +76,9 @@ def prompt_choice(
         response = input(prompt).strip()
         if not response and default_idx:
             return choices[default_idx - 1]
-        if response.isdigit():
-            idx = int(response)
-            if 1 <= idx <= len(choices):
-                return choices[idx - 1]
+        idx = parse_number(response)
+        if idx is not None and 1 <= idx <= len(choices):
+            return choices[idx - 1]
         print(_("error_invalid_choice", "Invalid response, please choose a valid index."))
 
 
@@ -83,7 +101,7 @@ def prompt_multi_value(
     message: str,
     *,
     default: Optional[Iterable[str]] = None,
-    formatter=lambda x: x,
+    formatter: Callable[[str], str] = lambda x: x,
 ) -> List[str]:
     """Prompt user to enter multiple lines until empty line."""
 
@@ -116,12 +134,13 @@ def _resolve_editor() -> str:
         if value:
             return value
 
-    command = ["gh", "config", "get", "editor"]
+    command = [gh_executable(), "config", "get", "editor"]
     try:
         completed = subprocess.run(
             command,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
+            close_fds=False,
             check=True,
         )
     except FileNotFoundError:
@@ -129,9 +148,9 @@ def _resolve_editor() -> str:
     except subprocess.CalledProcessError:
         completed = None
     if completed:
-        gh_editor = completed.stdout.decode("utf-8").strip()
+        gh_editor = completed.stdout.strip()
         if gh_editor:
-            return gh_editor
+            return gh_editor.decode("utf-8")
 
     if sys.platform == "win32":
         return "notepad"
@@ -148,6 +167,17 @@ def _resolve_editor() -> str:
     )
 
 
+def _editor_command(editor: str, path: Path) -> Union[str, List[str]]:
+    # The editor setting may carry arguments (``code --wait``). On POSIX it
+    # is split like a shell would, but run without one; as for gh, leaving
+    # the descriptors open lets subprocess use posix_spawn. Windows takes a
+    # command line string, which CreateProcess parses itself, so backslashes
+    # in paths such as C:\Windows\notepad.exe are kept.
+    if os.name == "nt":
+        return f"{editor} {subprocess.list2cmdline([str(path)])}"
+    return [*shlex.split(editor), str(path)]
+
+
 def open_editor_with_json(
     data: Any,
     *,
@@ -158,43 +188,42 @@ def open_editor_with_json(
 
     editor = _resolve_editor()
 
-    with tempfile.NamedTemporaryFile("w+", suffix=".json", delete=False) as tmp:
-        path = Path(tmp.name)
-        if header:
-            header_lines = header.strip().splitlines()
-            for line in header_lines:
-                tmp.write(f"# {line}\n")
-            tmp.write("\n")
-        json.dump(data, tmp, indent=2, ensure_ascii=False)
-        tmp.flush()
+    # The file is always UTF-8, whatever the locale.
+    document = json.dumps(data, indent=2, ensure_ascii=False)
+    if header:
+        document = "".join(f"# {line}\n" for line in header.strip().splitlines()) + "\n" + document
+    fd, name = tempfile.mkstemp(suffix=".json")
+    path = Path(name)
 
     try:
-        subprocess.run(f"{editor} {path}", shell=True, check=True)
-        with path.open("r", encoding="utf-8") as handle:
-            content = handle.read()
+        with os.fdopen(fd, "wb", buffering=0) as handle:
+            handle.write(document.encode("utf-8"))
+        try:
+            subprocess.run(_editor_command(editor, path), check=True, close_fds=False)
+        except (subprocess.CalledProcessError, OSError, ValueError) as exc:  # pragma: no cover - interactive flow
+            # Without a shell, unbalanced quotes in the setting (ValueError from
+            # shlex) and a missing or non-executable editor (OSError) surface
+            # here rather than as a failed shell command.
+            raise RuntimeError(
+                _("prompt_open_editor_error", "Editor exited with an error ({exc}).", exc=exc)
+            ) from exc
+        # json.loads takes the bytes as they are, and the comment markers
+        # are ASCII, so comment lines are filtered without decoding.
+        content = path.read_bytes()
         if allow_comments:
-            filtered_lines = []
-            for line in content.splitlines():
-                stripped = line.lstrip()
-                if stripped.startswith("#") or stripped.startswith("//"):
-                    continue
-                filtered_lines.append(line)
-            content = "\n".join(filtered_lines)
+            is_comment = _COMMENT_LINE_RE.match
+            content = b"\n".join(line for line in content.splitlines() if not is_comment(line))
         if not content.strip():
             raise RuntimeError(_("prompt_empty_editor_content", "Editor content is empty."))
         try:
             return json.loads(content)
-        except json.JSONDecodeError as exc:  # pragma: no cover - interactive flow
+        except (json.JSONDecodeError, UnicodeDecodeError) as exc:  # pragma: no cover - interactive flow
             raise RuntimeError(
                 _(
                     "prompt_invalid_json",
                     "Provided content is not valid JSON. Remove or fix annotations.",
                 )
             ) from exc
-    except subprocess.CalledProcessError as exc:  # pragma: no cover - interactive flow
-        raise RuntimeError(
-            _("prompt_open_editor_error", "Editor exited with an error ({exc}).", exc=exc)
-        ) from exc
     finally:
         try:
             path.unlink()
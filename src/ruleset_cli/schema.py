@@ -68,6 +68,7 @@ RULESET_SCHEMA = {
                         "properties": {"type": {"const": "required_status_checks"}},
                     },
                     "then": {
+                        "type": "object",
                         "required": ["parameters"],
                         "properties": {
                             "parameters": {"$ref": "#/$defs/required_status_checks"},
@@ -4,14 +4,14 @@ import subprocess
 from typing import Optional
 from urllib.parse import urlparse
 
-from .api import GitHubAPIError, Repository
+from .api import GitHubAPIError, Repository, gh_executable
 
 
 def parse_repository_input(value: str) -> Repository:
     """Parse repo input like owner/name or host/owner/name or URL."""
 
     value = value.strip()
-    if value.startswith("http://") or value.startswith("https://"):
+    if value.startswith(("http://", "https://")):
         parsed = urlparse(value)
         parts = [segment for segment in parsed.path.split("/") if segment]
         if len(parts) < 2:
@@ -41,7 +41,7 @@ def resolve_repository(repo_input: Optional[str]) -> Repository:
         return parse_repository_input(repo_input)
 
     command = [
-        "gh",
+        gh_executable(),
         "repo",
         "view",
         "--json",
@@ -54,6 +54,7 @@ def resolve_repository(repo_input: Optional[str]) -> Repository:
             command,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
+            close_fds=False,
             check=True,
         )
     except subprocess.CalledProcessError as exc:  # pragma: no cover - interactive flow
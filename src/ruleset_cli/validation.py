@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
 from .schema import RULESET_SCHEMA
 
@@ -9,101 +9,171 @@ def validate_ruleset_payload(payload: Dict[str, Any]) -> List[str]:
     """Return a list of validation errors for the ruleset payload."""
 
     errors: List[str] = []
-    _validate_schema(RULESET_SCHEMA, payload, path="payload", errors=errors)
-
-    # Additional semantic checks that are easier to express outside the schema.
-    bypasses = payload.get("bypass_actors")
-    if isinstance(bypasses, list):
-        for idx, actor in enumerate(bypasses):
-            if not isinstance(actor, dict):
-                continue
-            actor_type = actor.get("actor_type")
-            location = f"payload.bypass_actors[{idx}]"
-            if actor_type == "RepositoryRole" and not actor.get("repository_role_name"):
-                errors.append(f"{location}.repository_role_name est requis pour RepositoryRole.")
-            if actor_type in {"Team", "Integration"} and not isinstance(actor.get("actor_id"), int):
-                errors.append(f"{location}.actor_id doit être un entier pour {actor_type}.")
-
-    rules = payload.get("rules")
-    if isinstance(rules, list):
-        for idx, rule in enumerate(rules):
-            if not isinstance(rule, dict):
-                continue
-            if rule.get("type") == "required_status_checks":
-                params = rule.get("parameters", {})
-                checks = params.get("required_status_checks")
-                if isinstance(checks, list) and not checks:
-                    errors.append(
-                        f"payload.rules[{idx}].parameters.required_status_checks doit contenir au moins un check."
-                    )
+    _validate_ruleset_schema(payload, "payload", errors)
+    return errors
+
+
+def validate_rule(rule: Any) -> List[str]:
+    """Return a list of validation errors for a single rule object."""
 
+    errors: List[str] = []
+    _validate_rule_schema(rule, "rule", errors)
     return errors
 
 
-def _validate_schema(schema: Dict[str, Any], data: Any, *, path: str, errors: List[str]) -> None:
-    schema_type = schema.get("type")
-    if schema_type:
-        if not _type_matches(schema_type, data):
-            errors.append(f"{path}: type attendu '{schema_type}', obtenu '{type(data).__name__}'.")
-            return
+# Additional semantic checks that are easier to express outside the schema.
+# They run as part of the compiled validator of the $defs entry they extend,
+# once that node is known to be an object, so the payload is walked once.
+
+
+def _check_bypass_actor(actor: Dict[str, Any], location: str, errors: List[str]) -> None:
+    actor_type = actor.get("actor_type")
+    if actor_type == "RepositoryRole" and not actor.get("repository_role_name"):
+        errors.append(f"{location}.repository_role_name est requis pour RepositoryRole.")
+    if actor_type in {"Team", "Integration"} and not isinstance(actor.get("actor_id"), int):
+        errors.append(f"{location}.actor_id doit être un entier pour {actor_type}.")
+
+
+def _check_rule(rule: Dict[str, Any], location: str, errors: List[str]) -> None:
+    if rule.get("type") == "required_status_checks":
+        params = rule.get("parameters", {})
+        checks = params.get("required_status_checks") if isinstance(params, dict) else None
+        if isinstance(checks, list) and not checks:
+            errors.append(f"{location}.parameters.required_status_checks doit contenir au moins un check.")
 
-    if "enum" in schema and data not in schema["enum"]:
-        errors.append(f"{path}: valeur '{data}' hors de l'énumération {schema['enum']}.")
-        return
+
+# A compiled validator appends the problems found in ``data`` to ``errors``,
+# reporting them under ``path``.
+_Validator = Callable[[Any, str, List[str]], None]
+
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "object": lambda data: isinstance(data, dict),
+    "array": lambda data: isinstance(data, list),
+    "string": lambda data: isinstance(data, str),
+    "integer": lambda data: isinstance(data, int) and not isinstance(data, bool),
+    "boolean": lambda data: isinstance(data, bool),
+}
+
+_SCALAR_TYPES = frozenset({"string", "integer", "boolean"})
+
+# Marks an "if" property that only has to be present, with no "const".
+_ANY_VALUE = object()
+
+
+def _compile(
+    schema: Dict[str, Any],
+    refs: Dict[str, _Validator],
+    semantic_check: Optional[_Validator] = None,
+) -> _Validator:
+    """Turn a schema node into a validator for that node.
+
+    Everything that depends only on the schema (types, enums, properties,
+    references, conditions) is looked up here, once, so validating a
+    payload does not walk the schema dictionaries again. ``semantic_check``
+    runs last, on data that passed the type and enum checks.
+    """
+    if semantic_check is None and schema.keys() == {"$ref"}:
+        # A bare reference validates exactly like its target: reuse that
+        # validator rather than wrapping it in a node with nothing else to check.
+        return _compile_ref(schema["$ref"], refs)
+
+    schema_type = schema.get("type")
+    type_matches = _TYPE_CHECKS.get(schema_type)
+    enum = schema.get("enum")
+    # Scalar types are checked first, so their values can be hashed: test
+    # them against a frozenset. The list is kept for the error message.
+    allowed = frozenset(enum) if enum is not None and schema_type in _SCALAR_TYPES else enum
+    steps: List[_Validator] = []
 
     if schema_type == "object":
-        properties = schema.get("properties", {})
-        required = schema.get("required", [])
-        if isinstance(required, list):
+        required = tuple(schema.get("required") or ())
+        properties = {key: _compile(subschema, refs) for key, subschema in schema.get("properties", {}).items()}
+
+        def check_object(data: Dict[str, Any], path: str, errors: List[str]) -> None:
             for key in required:
                 if key not in data:
                     errors.append(f"{path}.{key} est requis.")
-        for key, value in data.items():
-            if key in properties:
-                _validate_schema(properties[key], value, path=f"{path}.{key}", errors=errors)
             # Unknown properties are ignored to keep validation permissive.
-        for key, subschema in properties.items():
-            if key in data:
-                continue
-            if subschema.get("default") is not None:
-                continue
-
-    if schema_type == "array":
-        item_schema = schema.get("items")
-        if item_schema:
+            for key, value in data.items():
+                validate_property = properties.get(key)
+                if validate_property is not None:
+                    validate_property(value, f"{path}.{key}", errors)
+
+        steps.append(check_object)
+
+    if schema_type == "array" and schema.get("items"):
+        validate_item = _compile(schema["items"], refs)
+
+        def check_array(data: List[Any], path: str, errors: List[str]) -> None:
             for idx, item in enumerate(data):
-                _validate_schema(item_schema, item, path=f"{path}[{idx}]", errors=errors)
+                validate_item(item, f"{path}[{idx}]", errors)
+
+        steps.append(check_array)
 
     min_length = schema.get("minLength")
-    if isinstance(min_length, int) and isinstance(data, str) and len(data) < min_length:
-        errors.append(f"{path}: longueur minimale {min_length} non atteinte.")
+    if isinstance(min_length, int):
+
+        def check_min_length(data: Any, path: str, errors: List[str]) -> None:
+            if isinstance(data, str) and len(data) < min_length:
+                errors.append(f"{path}: longueur minimale {min_length} non atteinte.")
+
+        steps.append(check_min_length)
 
     all_of = schema.get("allOf")
     if isinstance(all_of, list):
-        for subschema in all_of:
-            _validate_schema(subschema, data, path=path, errors=errors)
+        steps.extend(_compile(subschema, refs) for subschema in all_of)
 
-    # Handle conditional subschemas (if/then).
+    # Conditional subschemas (if/then).
     if "if" in schema and "then" in schema:
-        if _matches(schema["if"], data):
-            _validate_schema(schema["then"], data, path=path, errors=errors)
+        steps.append(_compile_conditional(schema["if"], _compile(schema["then"], refs)))
 
     if "$ref" in schema:
-        ref_schema = _resolve_ref(schema["$ref"])
-        if ref_schema:
-            _validate_schema(ref_schema, data, path=path, errors=errors)
+        steps.append(_compile_ref(schema["$ref"], refs))
+
+    if semantic_check is not None:
+        steps.append(semantic_check)
+
+    def validate(data: Any, path: str, errors: List[str]) -> None:
+        if type_matches is not None and not type_matches(data):
+            errors.append(f"{path}: type attendu '{schema_type}', obtenu '{type(data).__name__}'.")
+            return
+        if allowed is not None and data not in allowed:
+            errors.append(f"{path}: valeur '{data}' hors de l'énumération {enum}.")
+            return
+        for step in steps:
+            step(data, path, errors)
+
+    return validate
 
 
-def _matches(schema: Dict[str, Any], data: Any) -> bool:
-    """Minimal matcher for the subset of JSON schema features we need."""
-    expected_props = schema.get("properties")
-    if expected_props and isinstance(data, dict):
-        for key, prop_schema in expected_props.items():
-            if key not in data:
-                return False
-            if "const" in prop_schema and data[key] != prop_schema["const"]:
-                return False
-    return True
+def _compile_conditional(if_schema: Dict[str, Any], then: _Validator) -> _Validator:
+    """Minimal "if" support: listed properties must be present, and equal to their "const"."""
+
+    conditions = tuple(
+        (key, prop_schema.get("const", _ANY_VALUE)) for key, prop_schema in (if_schema.get("properties") or {}).items()
+    )
+
+    def check_conditional(data: Any, path: str, errors: List[str]) -> None:
+        if isinstance(data, dict):
+            for key, const in conditions:
+                if key not in data or (const is not _ANY_VALUE and data[key] != const):
+                    return
+        then(data, path, errors)
+
+    return check_conditional
+
+
+def _compile_ref(ref: str, refs: Dict[str, _Validator]) -> _Validator:
+    # Each reference is compiled once and shared by every node pointing to it.
+    validate = refs.get(ref)
+    if validate is None:
+        target = _resolve_ref(ref)
+        validate = refs[ref] = _compile(target, refs, _SEMANTIC_CHECKS.get(ref)) if target else _accept
+    return validate
+
+
+def _accept(data: Any, path: str, errors: List[str]) -> None:
+    """Validator of a reference that does not resolve: nothing to check."""
 
 
 def _resolve_ref(ref: str) -> Dict[str, Any] | None:
@@ -113,18 +183,15 @@ def _resolve_ref(ref: str) -> Dict[str, Any] | None:
     return RULESET_SCHEMA.get("$defs", {}).get(key)
 
 
-def _type_matches(schema_type: str, data: Any) -> bool:
-    if schema_type == "object":
-        return isinstance(data, dict)
-    if schema_type == "array":
-        return isinstance(data, list)
-    if schema_type == "string":
-        return isinstance(data, str)
-    if schema_type == "integer":
-        return isinstance(data, int) and not isinstance(data, bool)
-    if schema_type == "boolean":
-        return isinstance(data, bool)
-    return True
-
-
-__all__ = ["validate_ruleset_payload"]
+_SEMANTIC_CHECKS: Dict[str, _Validator] = {
+    "#/$defs/bypass_actor": _check_bypass_actor,
+    "#/$defs/rule": _check_rule,
+}
+
+# Compiled when the module is first imported, i.e. on the first validation.
+_COMPILED_REFS: Dict[str, _Validator] = {}
+_validate_ruleset_schema = _compile(RULESET_SCHEMA, _COMPILED_REFS)
+_validate_rule_schema = _compile_ref("#/$defs/rule", _COMPILED_REFS)
+
+
+__all__ = ["validate_rule", "validate_ruleset_payload"]